@@ -15,7 +15,9 @@ Features:
 
 import re
 import json
-from typing import Dict, List, Set, Tuple, Optional
+import heapq
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Set, Tuple, Optional
 from dataclasses import dataclass, asdict
 from collections import defaultdict
 from enum import Enum
@@ -59,6 +61,14 @@ class CitationStatus:
     authority_score: float  # 0-100: higher = more authoritative
 
 
+@dataclass
+class ExtractedCitation:
+    """Citation found in free text, with the relationship its context implies"""
+    citation: str
+    case_name: Optional[str]
+    relationship: Optional[CitationRelationship]
+
+
 @dataclass
 class PrecedentChain:
     """Shows evolution of legal principle across multiple cases"""
@@ -137,17 +147,52 @@ class GhanaCitationParser:
         for pattern in self.compiled_citation_patterns:
             matches = pattern.finditer(text)
             for match in matches:
-                # Normalize to [YYYY] COURT Number format
-                if len(match.groups()) >= 2:
-                    year = match.group(1)
-                    court_code = "GHASC"  # Default
-                    case_number = match.group(2) if len(match.groups()) == 2 else match.group(3)
-                    
-                    citation = f"[{year}] {court_code} {case_number}"
+                citation = self._normalize_match(match)
+                if citation:
                     citations.add(citation)
         
         return sorted(list(citations))
 
+    def extract_citations_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract citations from many texts in one scan per pattern
+        
+        Args:
+            texts: Texts to scan (e.g. numbered contentions)
+            
+        Returns:
+            Per-text lists of citations, as extract_citations() would return
+        """
+        if not texts:
+            return []
+        
+        # NUL never matches a citation pattern, so no match can span two texts
+        joined = "\0".join(texts)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        found: List[Set[str]] = [set() for _ in texts]
+        for pattern in self.compiled_citation_patterns:
+            for match in pattern.finditer(joined):
+                citation = self._normalize_match(match)
+                if citation:
+                    found[bisect_right(starts, match.start()) - 1].add(citation)
+        
+        return [sorted(citations) for citations in found]
+
+    @staticmethod
+    def _normalize_match(match: "re.Match") -> Optional[str]:
+        """Normalize a citation match to [YYYY] COURT Number format"""
+        if len(match.groups()) < 2:
+            return None
+        year = match.group(1)
+        court_code = "GHASC"  # Default
+        case_number = match.group(2) if len(match.groups()) == 2 else match.group(3)
+        return f"[{year}] {court_code} {case_number}"
+
     def detect_relationship(self, text: str, citation: str) -> Optional[CitationRelationship]:
         """
         Detect relationship between current case and cited case
@@ -206,6 +251,14 @@ class CitationNetworkGraph:
         self.citation_graph: Dict[str, List[Tuple[str, CitationRelationship]]] = defaultdict(list)
         self.reverse_citations: Dict[str, List[Tuple[str, CitationRelationship]]] = defaultdict(list)
         self.parser = GhanaCitationParser()
+        # Bumped on every change to the graph, so callers can tell when
+        # anything they derived from it is out of date
+        self.version = 0
+
+    def _graph_changed(self):
+        """Drop memoized statuses and bump the version after a change"""
+        self.case_status.clear()
+        self.version += 1
 
     def add_case_citations(
         self,
@@ -222,6 +275,7 @@ class CitationNetworkGraph:
             date_decided: Date case was decided
         """
         citations = self.parser.extract_citations(full_text)
+        added = False
         
         for citation in citations:
             # Extract relationship context
@@ -241,6 +295,55 @@ class CitationNetworkGraph:
                 self.relationships.append(rel)
                 self.citation_graph[case_id].append((citation, relationship))
                 self.reverse_citations[citation].append((case_id, relationship))
+                added = True
+        
+        if added:
+            self._graph_changed()
+
+    def extract_citations(self, text: str) -> List[ExtractedCitation]:
+        """
+        Extract citations from free text (e.g. a brief or pleading)
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Citations with the relationship implied by their context
+        """
+        return self.extract_citations_batch([text])[0]
+
+    def extract_citations_batch(
+        self,
+        texts: List[str],
+        limit: Optional[int] = None
+    ) -> List[List[ExtractedCitation]]:
+        """
+        Extract citations from many texts in a single scan
+        
+        Args:
+            texts: Texts to scan
+            limit: Stop after this many citations in total (earlier texts first)
+            
+        Returns:
+            Per-text lists of citations, aligned with texts
+        """
+        results: List[List[ExtractedCitation]] = []
+        remaining = limit
+        for text, citations in zip(texts, self.parser.extract_citations_batch(texts)):
+            if remaining is not None:
+                citations = citations[:remaining]
+                remaining -= len(citations)
+            results.append([
+                ExtractedCitation(
+                    citation=citation,
+                    case_name=None,
+                    relationship=self.parser.detect_relationship(
+                        self.parser.extract_citation_context(text, citation), citation
+                    )
+                )
+                for citation in citations
+            ])
+        return results
 
     def get_case_status(self, case_id: str) -> CitationStatus:
         """
@@ -353,6 +456,70 @@ class CitationNetworkGraph:
             results[rel_type].append(cited_case)
         return dict(results)
 
+    def find_cited_cases_bulk(
+        self,
+        case_ids: Iterable[str]
+    ) -> Dict[str, Dict[CitationRelationship, List[str]]]:
+        """
+        Find the cases cited by each of several cases in one call
+        
+        Args:
+            case_ids: Cases doing the citing
+            
+        Returns:
+            Dict mapping each case ID to its cited cases grouped by relationship
+        """
+        results = {}
+        for case_id in case_ids:
+            if case_id in results:
+                continue
+            grouped = defaultdict(list)
+            for cited_case, rel_type in self.citation_graph.get(case_id, ()):
+                grouped[rel_type].append(cited_case)
+            results[case_id] = dict(grouped)
+        return results
+
+    def rank_by_coupling(
+        self,
+        reference_ids: Iterable[str],
+        candidate_ids: Iterable[str],
+        limit: int = 10
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank candidate cases by citation overlap with a set of reference cases
+        
+        Each candidate scores the mean of two Jaccard similarities against
+        the references' combined neighbourhood: bibliographic coupling
+        (shared cited cases) and co-citation (shared citing cases).
+        
+        Args:
+            reference_ids: Cases the ranking is relative to
+            candidate_ids: Cases to rank
+            limit: Maximum number of candidates to return
+            
+        Returns:
+            (case_id, similarity) pairs, most similar first
+        """
+        def cited(case_id: str) -> frozenset:
+            return frozenset(c for c, _ in self.citation_graph.get(case_id, ()))
+        
+        def citing(case_id: str) -> frozenset:
+            return frozenset(c for c, _ in self.reverse_citations.get(case_id, ()))
+        
+        def jaccard(a: frozenset, b: frozenset) -> float:
+            union = len(a | b)
+            return len(a & b) / union if union else 0.0
+        
+        reference_ids = list(reference_ids)
+        ref_out = frozenset().union(*map(cited, reference_ids))
+        ref_in = frozenset().union(*map(citing, reference_ids))
+        
+        scored = (
+            (case_id, (jaccard(ref_out, cited(case_id)) + jaccard(ref_in, citing(case_id))) / 2)
+            for case_id in dict.fromkeys(candidate_ids)
+        )
+        return heapq.nlargest(limit, scored, key=lambda pair: pair[1])
+
     def get_network_stats(self) -> Dict:
         """Get statistics about the citation network"""
         unique_cases = set()
@@ -417,6 +584,8 @@ class CitationNetworkGraph:
             cited = rel_data["cited_case_id"]
             self.citation_graph[case_id].append((cited, rel_data["relationship_type"]))
             self.reverse_citations[cited].append((case_id, rel_data["relationship_type"]))
+        
+        self._graph_changed()
 
 
 # Global citation network
@@ -12,14 +12,27 @@ Features:
 - Structured output validation
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, Generator, Iterator, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+import asyncio
 import json
 import os
 import hashlib
+import re
+import random
+import time
+import functools
+import heapq
+import importlib.util
+import mmap
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from collections import defaultdict
+import math
 
 # Try importing various LLM libraries
 try:
@@ -28,6 +41,38 @@ try:
 except ImportError:
     HAS_OPENAI = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+    _ZSTD_ERRORS: Tuple[type, ...] = (zstandard.ZstdError,)
+except ImportError:
+    HAS_ZSTD = False
+    _ZSTD_ERRORS = ()
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
 try:
     from langchain.llms import OpenAI, HuggingFaceHub
     from langchain.prompts import PromptTemplate
@@ -48,6 +93,19 @@ class ModelProvider(Enum):
     MIXTRAL = "mixtral-8x7b"
 
 
+# Dense 0..N-1 index for array-based provider lookup, assigned once the
+# enum is complete rather than relying on member creation order internals
+for _ordinal, _provider in enumerate(ModelProvider):
+    _provider.ordinal = _ordinal
+del _ordinal, _provider
+
+
+SYSTEM_PROMPT = (
+    "You are an expert legal analyst specializing in Ghanaian law. "
+    "Provide structured, accurate legal analysis."
+)
+
+
 class TaskType(Enum):
     """LLM task categories"""
     BRIEF_GENERATION = "brief_generation"
@@ -66,6 +124,7 @@ class LLMConfig:
         ModelProvider.OPENAI_GPT35,
         ModelProvider.CLAUDE_3
     ])
+    system_prompt: str = SYSTEM_PROMPT
     temperature: float = 0.3  # Lower for legal analysis
     max_tokens: int = 2000
     top_p: float = 0.9
@@ -73,8 +132,11 @@ class LLMConfig:
     cache_ttl_hours: int = 24
     cost_tracking: bool = True
     api_timeout_seconds: int = 30
+    task_timeout_seconds: int = 300
     retry_attempts: int = 3
     retry_backoff_factor: float = 2.0
+    speculative: bool = False  # Race primary against first fallback
+    speculative_deadline_ms: int = 800
 
 
 @dataclass
@@ -88,6 +150,23 @@ class LLMResponse:
     cached: bool = False
     task_type: Optional[TaskType] = None
     confidence: float = 1.0
+    first_token_ts: Optional[float] = None  # Epoch seconds, set when streamed
+    last_token_ts: Optional[float] = None
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes (enums stored by value)"""
+        if HAS_ORJSON:
+            return orjson.dumps(self)
+        return json.dumps(asdict(self), default=lambda o: o.value).encode()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LLMResponse":
+        """Rebuild a response from its serialized form"""
+        data = dict(data)
+        data['provider'] = ModelProvider(data['provider'])
+        if data.get('task_type') is not None:
+            data['task_type'] = TaskType(data['task_type'])
+        return cls(**data)
 
 
 @dataclass
@@ -99,15 +178,69 @@ class PromptTemplate:
     required_variables: List[str]
     instructions: str = ""
     examples: List[Tuple[str, str]] = field(default_factory=list)  # (input, expected_output)
-
-    def format(self, **kwargs) -> str:
-        """Format template with variables"""
-        formatted = self.template
+    _literals: List[str] = field(init=False, repr=False, compare=False)
+    _slots: List[str] = field(init=False, repr=False, compare=False)
+    _literal_tokens: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Split once into literal segments around {var} / {{var}} slots
+        if self.required_variables:
+            names = "|".join(re.escape(var) for var in self.required_variables)
+            parts = re.split(r"\{\{?(" + names + r")\}?\}", self.template)
+        else:
+            parts = [self.template]
+        self._literals = parts[0::2]
+        self._slots = parts[1::2]
+        self._literal_tokens = {}  # encoding name -> token count of the literal segments
+
+    def _check_variables(self, kwargs: Dict[str, Any]) -> None:
         for var in self.required_variables:
             if var not in kwargs:
                 raise ValueError(f"Missing required variable: {var}")
-            formatted = formatted.replace(f"{{{{{var}}}}}", str(kwargs[var]))
-        return formatted
+
+    def format(self, **kwargs) -> str:
+        """Format template with variables"""
+        self._check_variables(kwargs)
+        pieces = [self._literals[0]]
+        for var, literal in zip(self._slots, self._literals[1:]):
+            pieces.append(str(kwargs[var]))
+            pieces.append(literal)
+        return "".join(pieces)
+
+    def count_tokens(self, encoding: Any, **kwargs) -> int:
+        """Token count of the formatted prompt; only the variables are tokenized per call"""
+        self._check_variables(kwargs)
+        count = self._literal_tokens.get(encoding.name)
+        if count is None:
+            count = sum(len(encoding.encode_ordinary(literal)) for literal in self._literals)
+            self._literal_tokens[encoding.name] = count
+        for var in self._slots:
+            count += len(encoding.encode_ordinary(str(kwargs[var])))
+        return count
+
+
+# Cached responses sampled before training a zstd dictionary, and its size
+ZSTD_DICT_SAMPLES = 1024
+ZSTD_DICT_SIZE = 16384
+
+# Number of most expensive requests reported by get_cost_summary()
+COST_TOP_K = 10
+
+# HTTP statuses worth retrying on the same model (rate limit / overload)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 529})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Check whether an LLM error is transient and worth retrying"""
+    cause = error.__cause__ or error
+    if isinstance(cause, (TimeoutError, ConnectionError)):
+        return True
+    if HAS_OPENAI:
+        if isinstance(cause, getattr(openai, "APIConnectionError", ())):
+            return True
+        if isinstance(cause, getattr(openai, "APIStatusError", ())):
+            return cause.status_code in RETRYABLE_STATUS_CODES
+    return False
 
 
 class LLMProvider(ABC):
@@ -118,13 +251,24 @@ class LLMProvider(ABC):
         """Generate text from prompt"""
         pass
 
+    async def agenerate(self, prompt: str, config: LLMConfig) -> LLMResponse:
+        """Generate text from prompt without blocking the event loop"""
+        return await asyncio.to_thread(self.generate, prompt, config)
+
+    def generate_stream(self, prompt: str, config: LLMConfig) -> Generator[str, None, LLMResponse]:
+        """Yield text chunks as they arrive and return the full response"""
+        response = self.generate(prompt, config)
+        response.first_token_ts = response.last_token_ts = time.time()
+        yield response.text
+        return response
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """Count tokens in text"""
         pass
 
     @abstractmethod
-    def estimate_cost(self, tokens: int) -> float:
+    def estimate_cost(self, model: ModelProvider, prompt_tokens: int, completion_tokens: int) -> float:
         """Estimate cost in USD"""
         pass
 
@@ -133,92 +277,190 @@ class OpenAIProvider(LLMProvider):
     """OpenAI API provider"""
 
     def __init__(self, api_key: Optional[str] = None):
-        if not HAS_OPENAI:
-            raise ImportError("OpenAI library not installed. Install with: pip install openai")
+        if not HAS_OPENAI or not hasattr(openai, "OpenAI"):
+            raise ImportError("OpenAI library (>=1.0) not installed. Install with: pip install openai")
         
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided and OPENAI_API_KEY not set")
         
-        openai.api_key = self.api_key
         self.model_costs = {
             ModelProvider.OPENAI_GPT4: (0.03, 0.06),  # (input, output) per 1K tokens
             ModelProvider.OPENAI_GPT35: (0.0005, 0.0015),
             ModelProvider.OPENAI_GPT4_TURBO: (0.01, 0.03),
         }
+        
+        # Persistent keep-alive pool: no TLS handshake per request
+        http_client = None
+        if HAS_HTTPX:
+            http_client = httpx.Client(
+                http2=HAS_HTTP2,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+            )
+        self.client = openai.OpenAI(api_key=self.api_key, http_client=http_client)
+        
+        # Async client is bound to the event loop it was created on
+        self._async_client = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _request_kwargs(self, prompt: str, config: LLMConfig) -> Dict[str, Any]:
+        """Build chat completion arguments for a prompt"""
+        return {
+            "model": config.primary_provider.value,
+            "messages": [
+                {"role": "system", "content": config.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "top_p": config.top_p,
+            "timeout": config.api_timeout_seconds,
+        }
+
+    def _to_response(self, response: Any, config: LLMConfig) -> LLMResponse:
+        """Convert a chat completion into an LLMResponse"""
+        usage = response.usage
+        return LLMResponse(
+            text=response.choices[0].message.content,
+            provider=config.primary_provider,
+            tokens_used=usage.total_tokens,
+            cost_usd=self.estimate_cost(config.primary_provider, usage.prompt_tokens, usage.completion_tokens)
+        )
+
+    def _get_async_client(self):
+        """Get pooled async client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            http_client = None
+            if HAS_HTTPX:
+                http_client = httpx.AsyncClient(
+                    http2=HAS_HTTP2,
+                    limits=httpx.Limits(max_connections=64),
+                )
+            self._async_client = openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._async_loop = loop
+        return self._async_client
 
     def generate(self, prompt: str, config: LLMConfig) -> LLMResponse:
         """Generate completion using OpenAI API"""
         try:
-            response = openai.ChatCompletion.create(
-                model=config.primary_provider.value,
-                messages=[
-                    {"role": "system", "content": "You are an expert legal analyst specializing in Ghanaian law. Provide structured, accurate legal analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                timeout=config.api_timeout_seconds,
+            response = self.client.chat.completions.create(**self._request_kwargs(prompt, config))
+            return self._to_response(response, config)
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+
+    def generate_stream(self, prompt: str, config: LLMConfig) -> Generator[str, None, LLMResponse]:
+        """Stream completion tokens from the OpenAI API"""
+        try:
+            stream = self.client.chat.completions.create(
+                **self._request_kwargs(prompt, config),
+                stream=True,
+                stream_options={"include_usage": True},
             )
-            
-            text = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens
-            cost = self.estimate_cost(tokens_used)
-            
-            return LLMResponse(
-                text=text,
-                provider=config.primary_provider,
-                tokens_used=tokens_used,
-                cost_usd=cost
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+        
+        parts: List[str] = []
+        first_token_ts: Optional[float] = None
+        usage = None
+        try:
+            for chunk in stream:
+                # Usage arrives on a final chunk with no choices
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    if first_token_ts is None:
+                        first_token_ts = time.time()
+                    parts.append(content)
+                    yield content
+        except Exception as e:
+            # Mid-stream failures surface like any other provider error
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+        
+        text = "".join(parts)
+        if usage is not None:
+            prompt_tokens, completion_tokens = usage.prompt_tokens, usage.completion_tokens
+        else:
+            prompt_tokens, completion_tokens = self.count_tokens(prompt), self.count_tokens(text)
+        return LLMResponse(
+            text=text,
+            provider=config.primary_provider,
+            tokens_used=prompt_tokens + completion_tokens,
+            cost_usd=self.estimate_cost(config.primary_provider, prompt_tokens, completion_tokens),
+            first_token_ts=first_token_ts,
+            last_token_ts=time.time(),
+        )
+
+    async def agenerate(self, prompt: str, config: LLMConfig) -> LLMResponse:
+        """Generate completion using the async OpenAI client"""
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                **self._request_kwargs(prompt, config)
             )
+            return self._to_response(response, config)
         except Exception as e:
-            raise RuntimeError(f"OpenAI API error: {str(e)}")
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
 
     def count_tokens(self, text: str) -> int:
         """Estimate token count (rough approximation)"""
         # Rough estimate: 1 token ≈ 4 characters
         return len(text) // 4
 
-    def estimate_cost(self, tokens: int) -> float:
-        """Estimate cost for GPT-4 (conservative estimate)"""
-        # GPT-4: $0.03 per 1K input, $0.06 per 1K output
-        return (tokens / 1000) * 0.06
+    def estimate_cost(self, model: ModelProvider, prompt_tokens: int, completion_tokens: int) -> float:
+        """Estimate cost from per-model input/output pricing"""
+        # Unknown models are priced as GPT-4 (conservative estimate)
+        input_price, output_price = self.model_costs.get(model, self.model_costs[ModelProvider.OPENAI_GPT4])
+        return (prompt_tokens * input_price + completion_tokens * output_price) / 1000
 
 
 class HuggingFaceProvider(LLMProvider):
     """HuggingFace open-source models provider"""
 
     def __init__(self, model_id: str = "meta-llama/Llama-2-70b-chat-hf"):
-        try:
-            from transformers import AutoTokenizer, AutoModelForCausalLM
-            self.tokenizer = AutoTokenizer.from_pretrained(model_id)
-            self.model_id = model_id
-        except ImportError:
+        # Only check availability here; the tokenizer loads on first use
+        if importlib.util.find_spec("transformers") is None:
             raise ImportError("transformers not installed. Install with: pip install transformers")
+        # A file lookup, not a download: the model must already be local
+        from huggingface_hub import try_to_load_from_cache
+        if not isinstance(try_to_load_from_cache(model_id, "tokenizer_config.json"), str):
+            raise RuntimeError(f"HuggingFace model {model_id} not found in the local cache")
+        self.model_id = model_id
+
+    @cached_property
+    def tokenizer(self):
+        """Fast (Rust) tokenizer, loaded on first use"""
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(self.model_id, use_fast=True)
 
     def generate(self, prompt: str, config: LLMConfig) -> LLMResponse:
         """Generate completion using HuggingFace model"""
         try:
             # For HuggingFace, we would load and run the model locally
             # This is a placeholder that requires additional setup
-            tokens_used = self.count_tokens(prompt) + config.max_tokens
-            
-            # In production, would call: pipeline('text-generation', model=self.model_id)
+            # In production, would tokenize once with encode_and_count() and
+            # pass those ids to model.generate(input_ids=input_ids, ...)
             # For now, return error indicating local setup needed
             raise NotImplementedError("Local HuggingFace inference requires GPU setup")
             
         except Exception as e:
-            raise RuntimeError(f"HuggingFace error: {str(e)}")
+            raise RuntimeError(f"HuggingFace error: {str(e)}") from e
+
+    def encode_and_count(self, text: str) -> Tuple[List[int], int]:
+        """Tokenize text in a single pass, returning ids and their count"""
+        input_ids = self.tokenizer.encode(text, add_special_tokens=False)
+        return input_ids, len(input_ids)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using tokenizer"""
         try:
-            return len(self.tokenizer.encode(text))
+            return self.encode_and_count(text)[1]
         except:
             return len(text) // 4
 
-    def estimate_cost(self, tokens: int) -> float:
+    def estimate_cost(self, model: ModelProvider, prompt_tokens: int, completion_tokens: int) -> float:
         """Open-source models have no API cost"""
         return 0.0
 
@@ -229,47 +471,121 @@ class LLMCache:
     def __init__(self, cache_dir: str = "data/llm_cache"):
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
+        # get() then set() on the same prompt hashes its text only once
+        self._prompt_digest = functools.lru_cache(maxsize=256)(self._hash_prompt)
+        
+        # zstd dictionary compression, enabled once a dictionary is trained
+        self._zstd_dict_path = os.path.join(cache_dir, "zstd.dict")
+        self._zstd_samples: List[bytes] = []
+        self._cctx = None
+        self._dctx = None
+        if HAS_ZSTD:
+            try:
+                with open(self._zstd_dict_path, 'rb') as f:
+                    self._load_zstd_dict(f.read())
+            except FileNotFoundError:
+                pass
+
+    def _load_zstd_dict(self, raw: bytes) -> None:
+        """Enable compression with a trained zstd dictionary"""
+        zstd_dict = zstandard.ZstdCompressionDict(raw)
+        self._cctx = zstandard.ZstdCompressor(level=3, dict_data=zstd_dict)
+        self._dctx = zstandard.ZstdDecompressor(dict_data=zstd_dict)
+
+    def _collect_zstd_sample(self, payload: bytes) -> None:
+        """Gather uncompressed entries and train a dictionary once enough are seen"""
+        self._zstd_samples.append(payload)
+        if len(self._zstd_samples) < ZSTD_DICT_SAMPLES:
+            return
+        
+        samples, self._zstd_samples = self._zstd_samples, []
+        try:
+            raw = zstandard.train_dictionary(ZSTD_DICT_SIZE, samples).as_bytes()
+        except zstandard.ZstdError:
+            return
+        
+        # Another process may have trained first; its dictionary wins
+        try:
+            with open(self._zstd_dict_path, 'xb') as f:
+                f.write(raw)
+        except FileExistsError:
+            with open(self._zstd_dict_path, 'rb') as f:
+                raw = f.read()
+        self._load_zstd_dict(raw)
+
+    @staticmethod
+    def _hash_prompt(prompt: str) -> "hashlib._Hash":
+        """Hash state over the prompt text, reusable across models"""
+        return hashlib.md5(prompt.encode())
 
     def _get_key(self, prompt: str, model: ModelProvider) -> str:
         """Generate cache key from prompt and model"""
-        content = f"{prompt}:{model.value}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # Same digest as md5(f"{prompt}:{model.value}"), resumed from the prompt state
+        digest = self._prompt_digest(prompt).copy()
+        digest.update(f":{model.value}".encode())
+        return digest.hexdigest()
+
+    def _load(self, cache_file: str, compressed: bool) -> Optional[Dict[str, Any]]:
+        """Load a cache entry, or None if it is missing or unreadable"""
+        # Open directly rather than stat first; a miss is one failed syscall
+        try:
+            fd = os.open(cache_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        
+        try:
+            # Parse straight from the page cache instead of read() into a copy
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as buf:
+                if compressed:
+                    raw = self._dctx.decompress(buf)
+                    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                if HAS_ORJSON:
+                    with memoryview(buf) as view:
+                        return orjson.loads(view)
+                return json.loads(buf[:])
+        except (OSError, ValueError, *_ZSTD_ERRORS):
+            return None
+        finally:
+            os.close(fd)
 
     def get(self, prompt: str, model: ModelProvider) -> Optional[LLMResponse]:
         """Retrieve cached response"""
         key = self._get_key(prompt, model)
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
+        cache_base = os.path.join(self.cache_dir, key)
         
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                    response = LLMResponse(**data)
-                    response.cached = True
-                    return response
-            except:
-                return None
-        return None
+        data = None
+        if self._dctx is not None:
+            data = self._load(f"{cache_base}.json.zst", compressed=True)
+        if data is None:
+            data = self._load(f"{cache_base}.json", compressed=False)
+        if data is None:
+            return None
+        
+        try:
+            response = LLMResponse.from_dict(data)
+        except (ValueError, TypeError, KeyError):
+            return None
+        response.cached = True
+        return response
 
     def set(self, prompt: str, response: LLMResponse) -> None:
         """Cache response"""
         key = self._get_key(prompt, response.provider)
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
+        cache_base = os.path.join(self.cache_dir, key)
         
         try:
-            with open(cache_file, 'w') as f:
-                data = {
-                    'text': response.text,
-                    'provider': response.provider.value,
-                    'tokens_used': response.tokens_used,
-                    'cost_usd': response.cost_usd,
-                    'timestamp': response.timestamp,
-                    'task_type': response.task_type.value if response.task_type else None,
-                    'confidence': response.confidence,
-                }
-                json.dump(data, f, indent=2)
-        except:
-            pass
+            payload = response.to_json()
+            if self._cctx is not None:
+                with open(f"{cache_base}.json.zst", 'wb') as f:
+                    f.write(self._cctx.compress(payload))
+                return
+            with open(f"{cache_base}.json", 'wb') as f:
+                f.write(payload)
+        except (OSError, TypeError):
+            return
+        
+        if HAS_ZSTD:
+            self._collect_zstd_sample(payload)
 
 
 class LLMOrchestrator:
@@ -278,9 +594,18 @@ class LLMOrchestrator:
     def __init__(self, config: Optional[LLMConfig] = None):
         self.config = config or LLMConfig()
         self.cache = LLMCache() if self.config.use_caching else None
-        self.providers: Dict[ModelProvider, LLMProvider] = {}
-        self.cost_tracker: Dict[str, List[float]] = {}
+        # Indexed by ModelProvider.ordinal; None where no provider is available
+        self.providers: List[Optional[LLMProvider]] = [None] * len(ModelProvider)
+        # Running per-task cost aggregates, updated in O(1) per response
+        self.cost_sums: Dict[str, float] = defaultdict(float)
+        self.cost_counts: Dict[str, int] = defaultdict(int)
+        self.cost_sumsq: Dict[str, float] = defaultdict(float)
+        # Min-heap of the COST_TOP_K most expensive (cost, task) requests
+        self.top_costs: List[Tuple[float, str]] = []
         self.prompt_templates: Dict[str, PromptTemplate] = self._load_prompt_templates()
+        self._format_prompt = functools.lru_cache(maxsize=256)(self._format_template)
+        self._system_prompt_tokens = functools.lru_cache(maxsize=16)(self._count_system_tokens)
+        self._inflight: Dict[Tuple[str, ModelProvider, TaskType, bool], asyncio.Future] = {}
         
         # Initialize primary provider
         self._initialize_providers()
@@ -293,7 +618,7 @@ class LLMOrchestrator:
             if openai_key:
                 provider = OpenAIProvider(openai_key)
                 for model in [ModelProvider.OPENAI_GPT4, ModelProvider.OPENAI_GPT35, ModelProvider.OPENAI_GPT4_TURBO]:
-                    self.providers[model] = provider
+                    self.providers[model.ordinal] = provider
         except:
             pass
         
@@ -301,7 +626,7 @@ class LLMOrchestrator:
         try:
             provider = HuggingFaceProvider()
             for model in [ModelProvider.LLAMA2_70B, ModelProvider.LLAMA2_13B, ModelProvider.MIXTRAL]:
-                self.providers[model] = provider
+                self.providers[model.ordinal] = provider
         except:
             pass
 
@@ -401,53 +726,260 @@ Analysis:""",
         prompt: str,
         task_type: TaskType = TaskType.LEGAL_RESEARCH,
         use_cache: bool = True,
-        retry: int = 0
+        system: Optional[str] = None
     ) -> LLMResponse:
         """Generate LLM response with caching and fallback"""
+        # A fixed `system` prompt keeps shared instructions in a stable,
+        # provider-cacheable prefix; only the user message varies
+        cache_key = self._cache_key(prompt, system)
+        
+        # Check cache
+        if use_cache and self.cache:
+            cached = self.cache.get(cache_key, self.config.primary_provider)
+            if cached:
+                return cached
+
+        # Try primary, then fallbacks, retrying transient errors with backoff
+        deadline = time.monotonic() + self.config.task_timeout_seconds
+        last_error: Optional[Exception] = None
+        for model in self._provider_chain():
+            if self.providers[model.ordinal] is None:
+                last_error = ValueError(f"Provider {model} not available")
+                continue
+            for attempt in range(max(1, self.config.retry_attempts)):
+                try:
+                    response = self._call_provider(prompt, model, system)
+                    return self._record_response(cache_key, response, task_type, use_cache)
+                except Exception as e:
+                    last_error = e
+                    delay = self._retry_delay(e, attempt, deadline)
+                    if delay is None:
+                        break
+                    time.sleep(delay)
+            if time.monotonic() >= deadline:
+                break
+        
+        raise RuntimeError(f"All LLM providers failed. Last error: {str(last_error)}")
+
+    def generate_stream(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.LEGAL_RESEARCH,
+        use_cache: bool = True,
+        system: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream LLM response text, caching the full response once complete"""
+        cache_key = self._cache_key(prompt, system)
+        
+        # Check cache
+        if use_cache and self.cache:
+            cached = self.cache.get(cache_key, self.config.primary_provider)
+            if cached:
+                yield cached.text
+                return
+
+        # Fall back to the next provider only if nothing has been streamed yet
+        last_error: Optional[Exception] = None
+        for model in self._provider_chain():
+            provider = self.providers[model.ordinal]
+            if provider is None:
+                last_error = ValueError(f"Provider {model} not available")
+                continue
+            stream = provider.generate_stream(prompt, self._provider_config(model, system))
+            try:
+                first = next(stream)
+            except StopIteration as done:
+                self._record_response(cache_key, done.value, task_type, use_cache)
+                return
+            except Exception as e:
+                last_error = e
+                continue
+            yield first
+            response = yield from stream
+            self._record_response(cache_key, response, task_type, use_cache)
+            return
+        
+        raise RuntimeError(f"All LLM providers failed. Last error: {str(last_error)}")
+
+    def _provider_chain(self) -> List[ModelProvider]:
+        """Primary provider followed by fallbacks, without duplicates"""
+        return list(dict.fromkeys([self.config.primary_provider, *self.config.fallback_providers]))
+
+    def _provider_config(self, model: ModelProvider, system: Optional[str] = None) -> LLMConfig:
+        """Per-call copy of the config targeting one model"""
+        if system is None:
+            return replace(self.config, primary_provider=model)
+        return replace(self.config, primary_provider=model, system_prompt=system)
+
+    @staticmethod
+    def _cache_key(prompt: str, system: Optional[str]) -> str:
+        """Cache lookup text; a custom system prompt is part of the request identity"""
+        if system is None:
+            return prompt
+        return f"{system}\n\n{prompt}"
+
+    def _call_provider(self, prompt: str, model: ModelProvider, system: Optional[str] = None) -> LLMResponse:
+        """Call the provider serving a model without mutating the shared config"""
+        return self.providers[model.ordinal].generate(prompt, self._provider_config(model, system))
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: float) -> Optional[float]:
+        """Backoff delay before retrying the same model, or None to move on"""
+        if not _is_retryable(error) or attempt + 1 >= self.config.retry_attempts:
+            return None
+        # Exponential backoff with jitter avoids stampeding a rate-limited API
+        delay = self.config.retry_backoff_factor ** (attempt + 1) * random.uniform(1.0, 2.0)
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def _record_response(
+        self,
+        cache_key: str,
+        response: LLMResponse,
+        task_type: TaskType,
+        use_cache: bool
+    ) -> LLMResponse:
+        """Tag, cache and cost-track a fresh provider response"""
+        response.task_type = task_type
+        
+        # Cache response
+        if use_cache and self.cache:
+            self.cache.set(cache_key, response)
+        
+        # Track cost
+        if self.config.cost_tracking:
+            task_name = task_type.value
+            self.cost_sums[task_name] += response.cost_usd
+            self.cost_counts[task_name] += 1
+            self.cost_sumsq[task_name] += response.cost_usd * response.cost_usd
+            if len(self.top_costs) < COST_TOP_K:
+                heapq.heappush(self.top_costs, (response.cost_usd, task_name))
+            else:
+                heapq.heappushpop(self.top_costs, (response.cost_usd, task_name))
+        
+        return response
+
+    async def agenerate(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.LEGAL_RESEARCH,
+        use_cache: bool = True,
+        system: Optional[str] = None
+    ) -> LLMResponse:
+        """Async variant of generate() for issuing concurrent requests"""
+        cache_key = self._cache_key(prompt, system)
         
         # Check cache
         if use_cache and self.cache:
-            cached = self.cache.get(prompt, self.config.primary_provider)
+            cached = self.cache.get(cache_key, self.config.primary_provider)
             if cached:
                 return cached
 
-        # Try primary provider
+        # Coalesce identical concurrent requests onto one provider round trip
+        key = (cache_key, self.config.primary_provider, task_type, use_cache)
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            return await asyncio.shield(pending)
+        
+        task = asyncio.ensure_future(self._agenerate_uncached(prompt, task_type, use_cache, system))
+        self._inflight[key] = task
         try:
-            if self.config.primary_provider not in self.providers:
-                raise ValueError(f"Provider {self.config.primary_provider} not available")
-            
-            provider = self.providers[self.config.primary_provider]
-            response = provider.generate(prompt, self.config)
-            response.task_type = task_type
-            
-            # Cache response
-            if use_cache and self.cache:
-                self.cache.set(prompt, response)
-            
-            # Track cost
-            if self.config.cost_tracking:
-                task_name = task_type.value
-                if task_name not in self.cost_tracker:
-                    self.cost_tracker[task_name] = []
-                self.cost_tracker[task_name].append(response.cost_usd)
-            
-            return response
+            return await asyncio.shield(task)
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+    async def _agenerate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType,
+        use_cache: bool,
+        system: Optional[str] = None
+    ) -> LLMResponse:
+        """Call providers for a prompt that missed the cache"""
+        cache_key = self._cache_key(prompt, system)
+        if self.config.speculative:
+            response = await self._agenerate_speculative(prompt, system)
+            if response is not None:
+                return self._record_response(cache_key, response, task_type, use_cache)
+
+        # Try primary, then fallbacks, retrying transient errors with backoff
+        deadline = time.monotonic() + self.config.task_timeout_seconds
+        last_error: Optional[Exception] = None
+        for model in self._provider_chain():
+            provider = self.providers[model.ordinal]
+            if provider is None:
+                last_error = ValueError(f"Provider {model} not available")
+                continue
+            for attempt in range(max(1, self.config.retry_attempts)):
+                try:
+                    response = await asyncio.wait_for(
+                        provider.agenerate(prompt, self._provider_config(model, system)),
+                        timeout=max(0.0, deadline - time.monotonic()),
+                    )
+                    return self._record_response(cache_key, response, task_type, use_cache)
+                except Exception as e:
+                    last_error = e
+                    delay = self._retry_delay(e, attempt, deadline)
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+            if time.monotonic() >= deadline:
+                break
         
-        except Exception as e:
-            # Try fallback providers
-            if retry < len(self.config.fallback_providers):
-                fallback = self.config.fallback_providers[retry]
-                if fallback in self.providers:
-                    original_primary = self.config.primary_provider
-                    self.config.primary_provider = fallback
-                    try:
-                        response = self.generate(prompt, task_type, use_cache=False, retry=retry + 1)
-                        self.config.primary_provider = original_primary
-                        return response
-                    except:
-                        self.config.primary_provider = original_primary
+        raise RuntimeError(f"All LLM providers failed. Last error: {str(last_error)}")
+
+    async def _agenerate_speculative(self, prompt: str, system: Optional[str] = None) -> Optional[LLMResponse]:
+        """Race the primary model against the first fallback as a latency hedge"""
+        chain = [model for model in self._provider_chain() if self.providers[model.ordinal] is not None]
+        if len(chain) < 2:
+            return None
+        
+        primary_task, draft_task = (
+            asyncio.ensure_future(
+                self.providers[model.ordinal].agenerate(prompt, self._provider_config(model, system))
+            )
+            for model in chain[:2]
+        )
+        try:
+            # Prefer the primary if it answers within the deadline
+            await asyncio.wait({primary_task}, timeout=self.config.speculative_deadline_ms / 1000)
             
-            raise RuntimeError(f"All LLM providers failed. Last error: {str(e)}")
+            # Otherwise take whichever succeeds first
+            pending = {primary_task, draft_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary_task, draft_task):
+                    if task in done and task.exception() is None:
+                        return task.result()
+            return None
+        finally:
+            for task in (primary_task, draft_task):
+                if not task.done():
+                    task.cancel()
+
+    async def generate_many(
+        self,
+        prompts: List[str],
+        task_type: TaskType = TaskType.LEGAL_RESEARCH
+    ) -> List[LLMResponse]:
+        """Generate responses for several prompts concurrently"""
+        return list(await asyncio.gather(*(self.agenerate(p, task_type) for p in prompts)))
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        task_type: TaskType = TaskType.LEGAL_RESEARCH
+    ) -> List[LLMResponse]:
+        """Synchronous wrapper around generate_many() for non-async callers"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.generate_many(prompts, task_type))
+        # Called from async code (e.g. a FastAPI handler): asyncio.run() would
+        # raise here, so run the batch on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.generate_many(prompts, task_type)).result()
 
     def generate_from_template(
         self,
@@ -459,9 +991,48 @@ Analysis:""",
             raise ValueError(f"Unknown template: {template_name}")
         
         template = self.prompt_templates[template_name]
-        prompt = template.format(**variables)
+        try:
+            prompt = self._format_prompt(template_name, tuple(sorted(variables.items())))
+        except TypeError:
+            # Unhashable variable values cannot be memoized
+            prompt = template.format(**variables)
         return self.generate(prompt, task_type=template.task_type)
 
+    def _format_template(self, template_name: str, variables: Tuple[Tuple[str, Any], ...]) -> str:
+        """Format a template; memoized per (template, variables) in __init__"""
+        return self.prompt_templates[template_name].format(**dict(variables))
+
+    @cached_property
+    def _encoding(self) -> Any:
+        """tiktoken encoding for OpenAI models, or None if unavailable"""
+        if not HAS_TIKTOKEN:
+            return None
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # Encoding files are downloaded on first use and may be unreachable
+            return None
+
+    def _count_system_tokens(self, system_prompt: str) -> int:
+        """Token count of a system prompt; memoized per prompt in __init__"""
+        return len(self._encoding.encode_ordinary(system_prompt))
+
+    def count_template_tokens(self, template_name: str, system: Optional[str] = None, **variables) -> int:
+        """Count prompt tokens (system prompt included) for a template request
+        
+        The system prompt counted is the one sent: `system` when given, as in
+        generate(), otherwise config.system_prompt.
+        """
+        if template_name not in self.prompt_templates:
+            raise ValueError(f"Unknown template: {template_name}")
+        
+        template = self.prompt_templates[template_name]
+        system_prompt = self.config.system_prompt if system is None else system
+        if self._encoding is None:
+            # Rough estimate: 1 token ≈ 4 characters
+            return (len(system_prompt) + len(template.format(**variables))) // 4
+        return self._system_prompt_tokens(system_prompt) + template.count_tokens(self._encoding, **variables)
+
     def get_cost_summary(self) -> Dict[str, Any]:
         """Get cost tracking summary"""
         summary = {
@@ -470,39 +1041,54 @@ Analysis:""",
             "tasks": {}
         }
         
-        for task_type, costs in self.cost_tracker.items():
-            task_total = sum(costs)
+        # O(T log T) over tasks; per-request history is never rescanned
+        by_total = sorted(self.cost_counts, key=self.cost_sums.__getitem__, reverse=True)
+        for task_type in by_total:
+            count = self.cost_counts[task_type]
+            task_total = self.cost_sums[task_type]
+            average = task_total / count if count else 0
+            variance = max(0.0, self.cost_sumsq[task_type] / count - average * average) if count else 0
             summary["tasks"][task_type] = {
-                "requests": len(costs),
+                "requests": count,
                 "total_cost_usd": round(task_total, 4),
-                "average_cost_usd": round(task_total / len(costs), 4) if costs else 0,
+                "average_cost_usd": round(average, 4),
+                "stddev_cost_usd": round(math.sqrt(variance), 4),
             }
             summary["total_cost_usd"] += task_total
         
         summary["total_cost_usd"] = round(summary["total_cost_usd"], 4)
+        summary["top_requests"] = [
+            {"task": task_type, "cost_usd": round(cost, 4)}
+            for cost, task_type in sorted(self.top_costs, reverse=True)
+        ]
         return summary
 
     def available_providers(self) -> List[ModelProvider]:
         """Get list of available providers"""
-        return list(self.providers.keys())
+        return [model for model in ModelProvider if self.providers[model.ordinal] is not None]
 
     def set_primary_provider(self, provider: ModelProvider) -> None:
         """Change primary LLM provider"""
-        if provider not in self.providers:
-            raise ValueError(f"Provider {provider} not available. Available: {list(self.providers.keys())}")
+        if self.providers[provider.ordinal] is None:
+            raise ValueError(f"Provider {provider} not available. Available: {self.available_providers()}")
         self.config.primary_provider = provider
 
 
 # Global instance
 _orchestrator: Optional[LLMOrchestrator] = None
+_orchestrator_lock = threading.Lock()
 
 
 def get_llm_orchestrator(config: Optional[LLMConfig] = None) -> LLMOrchestrator:
     """Get or create LLM orchestrator singleton"""
     global _orchestrator
-    if _orchestrator is None:
-        _orchestrator = LLMOrchestrator(config)
-    return _orchestrator
+    # Double-checked locking: the hot path is a single lock-free read
+    if _orchestrator is not None:
+        return _orchestrator
+    with _orchestrator_lock:
+        if _orchestrator is None:
+            _orchestrator = LLMOrchestrator(config)
+        return _orchestrator
 
 
 if __name__ == "__main__":
@@ -12,11 +12,26 @@ Features:
 - Legal citation integration
 """
 
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional, Any, Sequence, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
+import logging
+import re
+import threading
+
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from reasoning.llm_integration import (
     get_llm_orchestrator,
@@ -24,6 +39,9 @@ from reasoning.llm_integration import (
     LLMResponse
 )
 from intelligence.citation_network import get_citation_network
+from intelligence.legal_bert_integration import get_bert_integration
+
+logger = logging.getLogger(__name__)
 
 
 class PleadingType(Enum):
@@ -50,7 +68,263 @@ class CourtType(Enum):
     CUSTOMARY_COURT = "customary_court"
 
 
-@dataclass
+# Court-specific formatting rules
+_COURT_FORMATS: Mapping[CourtType, Mapping[str, str]] = MappingProxyType({
+    CourtType.SUPREME_COURT: MappingProxyType({
+        "name": "IN THE SUPREME COURT OF GHANA",
+        "caption_style": "IN THE SUPREME COURT OF GHANA\nHOLDING BOTH ORIGINAL AND APPELLATE JURISDICTION",
+        "case_format": "[YEAR] GHASC [NUMBER]",
+        "filing_rules": "Must include bench constitution",
+        "page_style": "A4, 1.5 line spacing"
+    }),
+    CourtType.COURT_OF_APPEAL: MappingProxyType({
+        "name": "IN THE COURT OF APPEAL OF GHANA",
+        "caption_style": "IN THE COURT OF APPEAL OF GHANA",
+        "case_format": "[YEAR] SCGLR/CA [NUMBER]",
+        "filing_rules": "Appellant and Respondent parties only",
+        "page_style": "A4, 1.5 line spacing"
+    }),
+    CourtType.HIGH_COURT: MappingProxyType({
+        "name": "IN THE HIGH COURT OF JUSTICE",
+        "caption_style": "IN THE HIGH COURT OF JUSTICE, ACCRA",
+        "case_format": "HC/[YEAR]/[NUMBER]",
+        "filing_rules": "Standard civil procedure applies",
+        "page_style": "A4, 1.5 line spacing"
+    }),
+    CourtType.CIRCUIT_COURT: MappingProxyType({
+        "name": "IN THE CIRCUIT COURT",
+        "caption_style": "IN THE CIRCUIT COURT AT [LOCATION]",
+        "case_format": "CC/[YEAR]/[NUMBER]",
+        "filing_rules": "Limited jurisdiction rules apply",
+        "page_style": "A4, single spacing"
+    })
+})
+
+# Constant head of each court's caption, up to the case number
+_CAPTION_PREFIXES: Mapping[CourtType, str] = MappingProxyType({
+    court: f"{court_format['caption_style']}\n\nCASE NO. "
+    for court, court_format in _COURT_FORMATS.items()
+})
+
+# Pleading templates
+_TEMPLATES: Mapping[PleadingType, str] = MappingProxyType({
+    PleadingType.SUMMONS: """TO THE ABOVE NAMED DEFENDANT:
+
+This Summons is issued against you by the above named Plaintiff(s).
+
+You are required to ENTER an APPEARANCE within {appearance_period} days from the service of this Summons on you, failing which the Plaintiff(s) may proceed and judgment may be given against you without further notice.
+
+If you intend to defend this action, you must file and serve a DEFENCE on the Plaintiff(s) or the Plaintiff's Solicitors within {defence_period} days after the expiry of the period within which you were required to enter an appearance.
+
+TAKE NOTE: If you do not enter an appearance or file a Defence, judgment may be entered against you by default.
+
+Dated at {location} this _____ day of _________ 20____
+
+                                        COURT SEAL/STAMP
+
+{solicitor_details}""",
+
+    PleadingType.STATEMENT_OF_CLAIM: """STATEMENT OF CLAIM
+
+The Plaintiff/Appellant claims against the Defendant/Respondent as follows:
+
+[FACTS]
+
+PARTICULARS OF CLAIM
+
+[ALLEGATIONS]
+
+[RELIEF SOUGHT]
+
+And the Plaintiff claims accordingly.""",
+
+    PleadingType.DEFENCE: """DEFENCE
+
+The Defendant/Respondent hereby makes the following defence to the Statement of Claim:
+
+1. The Defendant admits the allegations in paragraphs [NUMBERS] of the Statement of Claim.
+
+2. The Defendant denies the allegations in paragraphs [NUMBERS] of the Statement of Claim.
+
+3. As to the remaining allegations, the Defendant puts the Plaintiff to the proof thereof.
+
+4. [SPECIFIC DEFENCES]
+
+And the Defendant contends that the Plaintiff has not proved the case and claims that the action be dismissed.""",
+
+    PleadingType.AFFIDAVIT: """AFFIDAVIT
+
+I, {deponent_name}, of {deponent_address}, [occupation], make oath and state as follows:
+
+{numbered_statements}
+
+AND I make this solemn affidavit conscientiously believing the same to be true and by virtue of the Statutory Declarations Act, 1972 (N.R.C.D. 110).
+
+                                    ________________________
+                                    [DEPONENT SIGNATURE]
+
+Dated at {location} this _____ day of _________ 20____
+
+[SWORN BEFORE ME]
+                                    ________________________
+                                    [COMMISSIONER NAME]
+                                    Commissioner for Oaths""",
+
+    PleadingType.APPLICATION: """IN THE HIGH COURT OF JUSTICE
+APPLICATION FOR [RELIEF SOUGHT]
+
+Notice of Motion
+Take notice that the applicant {applicant_name} will apply to this Honourable Court on [DATE] at [TIME] or such other date as Counsel may be heard for the following relief:
+
+[APPLICATION RELIEF]
+
+Grounds:
+{grounds}
+
+Dated at {location} this _____ day of _________ 20____
+
+                                        {solicitor_name}
+                                        Applicant's Counsel"""
+})
+
+# Document titles per pleading type
+_TITLE_MAP: Mapping[PleadingType, str] = MappingProxyType({
+    PleadingType.SUMMONS: "SUMMONS",
+    PleadingType.STATEMENT_OF_CLAIM: "STATEMENT OF CLAIM",
+    PleadingType.DEFENCE: "DEFENCE",
+    PleadingType.COUNTERCLAIM: "COUNTERCLAIM",
+    PleadingType.REPLY: "REPLY",
+    PleadingType.AFFIDAVIT: "AFFIDAVIT",
+    PleadingType.APPLICATION: "APPLICATION FOR RELIEF"
+})
+
+# Fact-expansion instructions per pleading type, sent as the system message so
+# the shared prefix is identical across calls and eligible for prompt caching
+SYSTEM_PROMPT_FACTS: Mapping[PleadingType, str] = MappingProxyType({
+    pleading_type: (
+        "You are an expert legal drafter specializing in Ghanaian law. "
+        "Based on the facts provided, generate 5-7 detailed numbered factual paragraphs "
+        f"suitable for a {pleading_type.value.replace('_', ' ')} in Ghana courts. "
+        "Format as numbered paragraphs (1. ... 2. ..., etc)."
+    )
+    for pleading_type in PleadingType
+})
+
+# Paragraph number near the start of a line ("1.", "(1)", "**1.**", ...);
+# searched within a line's first three characters
+_NUMBERED_RE = re.compile(r'\d')
+
+# Reuse of fact expansions. Exact repeats of a fact set always reuse; the
+# semantic match of near-duplicates is opt-in, as reused paragraphs go
+# straight into a filing
+SEMANTIC_FACTS_CACHE = False  # Default for PleadingsAssistant(semantic_facts_cache=...)
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity for a hit
+SEMANTIC_CACHE_SIZE = 512  # Entries kept per (pleading type, court), LRU
+SEMANTIC_CACHE_MAX_CHARS = 2000  # Legal-BERT only embeds this much of a text
+
+# Concurrent LLM requests allowed in batch_generate
+BATCH_CONCURRENCY = 8
+
+# Names, amounts and dates in a fact set: capitalised words and digit runs
+_FACT_DETAIL_RE = re.compile(r"\b[A-Z][\w'-]*|\d(?:[\d,./:-]*\d)?")
+
+
+def _fact_details(text: str) -> frozenset:
+    """Parties, amounts and dates mentioned in a fact set"""
+    return frozenset(_FACT_DETAIL_RE.findall(text))
+
+
+class _FactsCache:
+    """Reuse LLM fact expansions across repeated fact sets
+
+    Entries are grouped by (pleading type, court) so only same-context
+    expansions can match. An identical fact set always matches, without
+    embedding it. With semantic=True a near-duplicate also matches, but only
+    if it mentions exactly the same names, numbers and dates; embeddings come
+    from Legal-BERT, and without it only exact repeats match.
+    """
+
+    def __init__(
+        self,
+        semantic: bool = SEMANTIC_FACTS_CACHE,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_SIZE
+    ):
+        self.semantic = semantic
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[
+            Tuple[PleadingType, CourtType],
+            "OrderedDict[str, Tuple[Optional[np.ndarray], frozenset, Tuple[str, ...]]]"
+        ] = {}
+        self._bert = None
+        self._bert_loaded = False
+
+    def get(self, context: Tuple[PleadingType, CourtType], text: str) -> Optional[Tuple[str, ...]]:
+        """Cached expansion of exactly this fact set"""
+        entries = self._entries.get(context)
+        if not entries or text not in entries:
+            return None
+        entries.move_to_end(text)
+        return entries[text][2]
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Unit-normalized embedding of text, or None if it cannot be matched semantically
+
+        Texts longer than SEMANTIC_CACHE_MAX_CHARS are not embedded: Legal-BERT
+        would only see their prefix, so different fact sets could look identical.
+        """
+        if not self.semantic or len(text) > SEMANTIC_CACHE_MAX_CHARS:
+            return None
+        if not self._bert_loaded:
+            # Model loads on first use, not when the assistant is constructed
+            self._bert = get_bert_integration()
+            self._bert_loaded = True
+        if self._bert is None:
+            return None
+        
+        try:
+            vec = np.asarray(self._bert.embed_text(text), dtype=np.float32)
+        except (RuntimeError, ValueError):
+            return None
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else None
+
+    def similar(self, context: Tuple[PleadingType, CourtType], text: str, vec: np.ndarray) -> Optional[Tuple[str, ...]]:
+        """Cached expansion of the most similar fact set with the same details, if similar enough"""
+        entries = self._entries.get(context)
+        if not entries:
+            return None
+        
+        details = _fact_details(text)
+        keys = [key for key, (entry_vec, entry_details, _) in entries.items()
+                if entry_vec is not None and entry_details == details]
+        if not keys:
+            return None
+        sims = np.stack([entries[k][0] for k in keys]) @ vec
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        entries.move_to_end(keys[best])
+        return entries[keys[best]][2]
+
+    def insert(
+        self,
+        context: Tuple[PleadingType, CourtType],
+        text: str,
+        vec: Optional[np.ndarray],
+        expanded: Tuple[str, ...]
+    ) -> None:
+        """Store an expansion, evicting the least recently used entry when full"""
+        entries = self._entries.setdefault(context, OrderedDict())
+        entries[text] = (vec, _fact_details(text), expanded)
+        entries.move_to_end(text)
+        if len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+
+@dataclass(frozen=True, slots=True)
 class Party:
     """Party to litigation"""
     name: str
@@ -59,9 +333,25 @@ class Party:
     lawyer: Optional[str] = None
     lawyer_address: Optional[str] = None
     reference: Optional[str] = None
+    # Caption form of the name, computed once (the party is immutable)
+    _name_upper: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_name_upper', self.name.upper())
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'name': self.name,
+            'capacity': self.capacity,
+            'address': self.address,
+            'lawyer': self.lawyer,
+            'lawyer_address': self.lawyer_address,
+            'reference': self.reference
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class ClaimDetail:
     """Individual claim or allegation"""
     description: str
@@ -70,7 +360,7 @@ class ClaimDetail:
     relief_type: str = "general"  # "damages", "specific performance", "injunction", "declaratory"
 
 
-@dataclass
+@dataclass(slots=True)
 class PleadingMetadata:
     """Metadata for pleading document"""
     case_name: str
@@ -83,8 +373,22 @@ class PleadingMetadata:
     previous_actions: Optional[List[str]] = field(default_factory=list)
     limitation_period_expires: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'case_name': self.case_name,
+            'case_number': self.case_number,
+            'court': self.court.value,
+            'filing_date': self.filing_date,
+            'plaintiff': self.plaintiff.to_dict(),
+            'defendant': self.defendant.to_dict(),
+            'judge_assigned': self.judge_assigned,
+            'previous_actions': self.previous_actions,
+            'limitation_period_expires': self.limitation_period_expires
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Pleading:
     """Generated pleading document"""
     pleading_type: PleadingType
@@ -104,7 +408,7 @@ class Pleading:
     signatures: List[Dict[str, str]] = field(default_factory=list)
     
     # Metadata
-    generated_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    generated_date: str = ""  # Stamped by PleadingsAssistant when generated
     version: str = "1.0"
     generation_tokens: int = 0
     generation_cost: float = 0.0
@@ -112,42 +416,47 @@ class Pleading:
 
     def to_text(self) -> str:
         """Convert to plain text format"""
-        doc = f"""{self.caption}
+        parts: List[str] = [f"""{self.caption}
 
 {self.title}
 
 {self.preamble}
 
 FACTS AND BACKGROUND
-"""
+"""]
+        # Plain f-string appends are as fast as any pure-Python variant here
+        # (map/str.format is ~2x slower); the single join keeps this linear
         for i, fact in enumerate(self.facts, 1):
-            doc += f"{i}. {fact}\n\n"
+            parts.append(f"{i}. {fact}\n\n")
         
-        doc += "\nLEGAL CONTENTIONS\n"
+        parts.append("\nLEGAL CONTENTIONS\n")
         for i, contention in enumerate(self.legal_contentions, 1):
-            doc += f"{i}. {contention}\n\n"
+            parts.append(f"{i}. {contention}\n\n")
         
-        doc += "\nRELIEF SOUGHT\n"
-        for relief in self.relief_sought:
-            doc += f"• {relief}\n"
+        parts.append("\nRELIEF SOUGHT\n")
+        parts.extend(f"• {relief}\n" for relief in self.relief_sought)
         
         if self.verification:
-            doc += f"\n\nVERIFICATION\n{self.verification}\n"
+            parts.append(f"\n\nVERIFICATION\n{self.verification}\n")
         
         if self.conclusion:
-            doc += f"\n\n{self.conclusion}\n"
+            parts.append(f"\n\n{self.conclusion}\n")
         
-        doc += "\n\nDated this _____ day of _________ 20____\n\n"
+        parts.append("\n\nDated this _____ day of _________ 20____\n\n")
         for sig in self.signatures:
-            doc += f"____________________\n{sig.get('name', '')}\n"
+            parts.append(f"____________________\n{sig.get('name', '')}\n")
             if sig.get('title'):
-                doc += f"{sig.get('title')}\n"
-            doc += "\n\n"
+                parts.append(f"{sig.get('title')}\n")
+            parts.append("\n\n")
         
-        return doc
+        return "".join(parts)
 
-    def to_docx(self) -> bytes:
-        """Export to Word document format"""
+    def to_docx(self, fileobj: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Export to Word document format
+        
+        Writes straight to `fileobj` when given (returns None); otherwise
+        returns the document bytes.
+        """
         try:
             from docx import Document
             from docx.shared import Pt, RGBColor
@@ -188,6 +497,11 @@ FACTS AND BACKGROUND
                 for citation in self.citations:
                     doc.add_paragraph(f"{citation.get('name', '')}: {citation.get('citation', '')}")
             
+            # Save directly to the caller's file, avoiding an in-memory copy
+            if fileobj is not None:
+                doc.save(fileobj)
+                return None
+            
             # Save to bytes
             import io
             output = io.BytesIO()
@@ -198,137 +512,44 @@ FACTS AND BACKGROUND
             raise ImportError("python-docx not installed. Install with: pip install python-docx")
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (lists are shared with the pleading, not copied)"""
+        return {
+            'pleading_type': self.pleading_type.value,
+            'metadata': self.metadata.to_dict(),
+            'caption': self.caption,
+            'title': self.title,
+            'preamble': self.preamble,
+            'facts': self.facts,
+            'legal_contentions': self.legal_contentions,
+            'relief_sought': self.relief_sought,
+            'verification': self.verification,
+            'conclusion': self.conclusion,
+            'signatures': self.signatures,
+            'generated_date': self.generated_date,
+            'version': self.version,
+            'generation_tokens': self.generation_tokens,
+            'generation_cost': self.generation_cost,
+            'citations': self.citations
+        }
 
     def to_json(self) -> str:
         """Convert to JSON"""
+        if HAS_ORJSON:
+            # Serializes the dataclass tree (enums by value) without a staging dict
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2, default=str)
 
 
 class PleadingsAssistant:
     """Generate professional legal pleadings"""
 
-    def __init__(self):
+    def __init__(self, semantic_facts_cache: bool = SEMANTIC_FACTS_CACHE):
         self.llm = get_llm_orchestrator()
         self.citation_network = get_citation_network()
-        self.court_formats = self._load_court_formats()
-        self.templates = self._load_templates()
-
-    def _load_court_formats(self) -> Dict[CourtType, Dict[str, str]]:
-        """Load court-specific formatting rules"""
-        return {
-            CourtType.SUPREME_COURT: {
-                "name": "IN THE SUPREME COURT OF GHANA",
-                "caption_style": "IN THE SUPREME COURT OF GHANA\nHOLDING BOTH ORIGINAL AND APPELLATE JURISDICTION",
-                "case_format": "[YEAR] GHASC [NUMBER]",
-                "filing_rules": "Must include bench constitution",
-                "page_style": "A4, 1.5 line spacing"
-            },
-            CourtType.COURT_OF_APPEAL: {
-                "name": "IN THE COURT OF APPEAL OF GHANA",
-                "caption_style": "IN THE COURT OF APPEAL OF GHANA",
-                "case_format": "[YEAR] SCGLR/CA [NUMBER]",
-                "filing_rules": "Appellant and Respondent parties only",
-                "page_style": "A4, 1.5 line spacing"
-            },
-            CourtType.HIGH_COURT: {
-                "name": "IN THE HIGH COURT OF JUSTICE",
-                "caption_style": "IN THE HIGH COURT OF JUSTICE, ACCRA",
-                "case_format": "HC/[YEAR]/[NUMBER]",
-                "filing_rules": "Standard civil procedure applies",
-                "page_style": "A4, 1.5 line spacing"
-            },
-            CourtType.CIRCUIT_COURT: {
-                "name": "IN THE CIRCUIT COURT",
-                "caption_style": "IN THE CIRCUIT COURT AT [LOCATION]",
-                "case_format": "CC/[YEAR]/[NUMBER]",
-                "filing_rules": "Limited jurisdiction rules apply",
-                "page_style": "A4, single spacing"
-            }
-        }
-
-    def _load_templates(self) -> Dict[PleadingType, str]:
-        """Load pleading templates"""
-        return {
-            PleadingType.SUMMONS: """TO THE ABOVE NAMED DEFENDANT:
-
-This Summons is issued against you by the above named Plaintiff(s).
-
-You are required to ENTER an APPEARANCE within {appearance_period} days from the service of this Summons on you, failing which the Plaintiff(s) may proceed and judgment may be given against you without further notice.
-
-If you intend to defend this action, you must file and serve a DEFENCE on the Plaintiff(s) or the Plaintiff's Solicitors within {defence_period} days after the expiry of the period within which you were required to enter an appearance.
-
-TAKE NOTE: If you do not enter an appearance or file a Defence, judgment may be entered against you by default.
-
-Dated at {location} this _____ day of _________ 20____
-
-                                        COURT SEAL/STAMP
-
-{solicitor_details}""",
-
-            PleadingType.STATEMENT_OF_CLAIM: """STATEMENT OF CLAIM
-
-The Plaintiff/Appellant claims against the Defendant/Respondent as follows:
-
-[FACTS]
-
-PARTICULARS OF CLAIM
-
-[ALLEGATIONS]
-
-[RELIEF SOUGHT]
-
-And the Plaintiff claims accordingly.""",
-
-            PleadingType.DEFENCE: """DEFENCE
-
-The Defendant/Respondent hereby makes the following defence to the Statement of Claim:
-
-1. The Defendant admits the allegations in paragraphs [NUMBERS] of the Statement of Claim.
-
-2. The Defendant denies the allegations in paragraphs [NUMBERS] of the Statement of Claim.
-
-3. As to the remaining allegations, the Defendant puts the Plaintiff to the proof thereof.
-
-4. [SPECIFIC DEFENCES]
-
-And the Defendant contends that the Plaintiff has not proved the case and claims that the action be dismissed.""",
-
-            PleadingType.AFFIDAVIT: """AFFIDAVIT
-
-I, {deponent_name}, of {deponent_address}, [occupation], make oath and state as follows:
-
-{numbered_statements}
-
-AND I make this solemn affidavit conscientiously believing the same to be true and by virtue of the Statutory Declarations Act, 1972 (N.R.C.D. 110).
-
-                                    ________________________
-                                    [DEPONENT SIGNATURE]
-
-Dated at {location} this _____ day of _________ 20____
-
-[SWORN BEFORE ME]
-                                    ________________________
-                                    [COMMISSIONER NAME]
-                                    Commissioner for Oaths""",
-
-            PleadingType.APPLICATION: """IN THE HIGH COURT OF JUSTICE
-APPLICATION FOR [RELIEF SOUGHT]
-
-Notice of Motion
-Take notice that the applicant {applicant_name} will apply to this Honourable Court on [DATE] at [TIME] or such other date as Counsel may be heard for the following relief:
-
-[APPLICATION RELIEF]
-
-Grounds:
-{grounds}
-
-Dated at {location} this _____ day of _________ 20____
-
-                                        {solicitor_name}
-                                        Applicant's Counsel"""
-        }
+        self.court_formats = _COURT_FORMATS
+        self.templates = _TEMPLATES
+        # Reuse of fact expansions within this process
+        self._facts_cache = _FactsCache(semantic=semantic_facts_cache)
 
     def generate_pleading(
         self,
@@ -337,37 +558,67 @@ Dated at {location} this _____ day of _________ 20____
         facts: List[str],
         legal_basis: List[str],
         relief_sought: List[str],
-        use_llm: bool = True
+        use_llm: bool = True,
+        generated_date: Optional[str] = None
     ) -> Pleading:
         """Generate a pleading document"""
         
-        court_format = self.court_formats[metadata.court]
+        # Generate detailed facts using LLM if needed
+        facts_numbered = facts
+        if use_llm:
+            # Use LLM to expand and refine facts
+            try:
+                facts_numbered = self._expand_facts_cached(pleading_type, metadata.court, facts)
+            except (RuntimeError, TimeoutError, ConnectionError) as e:
+                # The orchestrator has already retried; draft with the facts as given
+                logger.warning("Fact expansion failed, using facts as given: %s", e)
+                facts_numbered = facts
         
-        # Build caption
-        caption = f"""{court_format['caption_style']}
-
-CASE NO. {metadata.case_number}
+        return self._build_pleading(pleading_type, metadata, facts_numbered, legal_basis, relief_sought, generated_date)
 
-BETWEEN
-
-{metadata.plaintiff.name.upper()}
-(Plaintiff/Appellant)
--and-
+    async def agenerate_pleading(
+        self,
+        pleading_type: PleadingType,
+        metadata: PleadingMetadata,
+        facts: List[str],
+        legal_basis: List[str],
+        relief_sought: List[str],
+        use_llm: bool = True,
+        generated_date: Optional[str] = None
+    ) -> Pleading:
+        """Async variant of generate_pleading() for issuing concurrent requests"""
+        
+        facts_numbered = facts
+        if use_llm:
+            try:
+                facts_numbered = await self._aexpand_facts_cached(pleading_type, metadata.court, facts)
+            except (RuntimeError, TimeoutError, ConnectionError) as e:
+                logger.warning("Fact expansion failed, using facts as given: %s", e)
+                facts_numbered = facts
+        
+        return self._build_pleading(pleading_type, metadata, facts_numbered, legal_basis, relief_sought, generated_date)
 
-{metadata.defendant.name.upper()}
-(Defendant/Respondent)"""
+    def _build_pleading(
+        self,
+        pleading_type: PleadingType,
+        metadata: PleadingMetadata,
+        facts_numbered: List[str],
+        contentions_numbered: List[str],
+        relief_sought: List[str],
+        generated_date: Optional[str] = None
+    ) -> Pleading:
+        """Assemble a pleading around already-generated facts"""
+        
+        # Build caption
+        caption = (
+            f"{_CAPTION_PREFIXES[metadata.court]}{metadata.case_number}\n\n"
+            f"BETWEEN\n\n"
+            f"{metadata.plaintiff._name_upper}\n(Plaintiff/Appellant)\n-and-\n\n"
+            f"{metadata.defendant._name_upper}\n(Defendant/Respondent)"
+        )
         
         # Build title
-        title_map = {
-            PleadingType.SUMMONS: "SUMMONS",
-            PleadingType.STATEMENT_OF_CLAIM: "STATEMENT OF CLAIM",
-            PleadingType.DEFENCE: "DEFENCE",
-            PleadingType.COUNTERCLAIM: "COUNTERCLAIM",
-            PleadingType.REPLY: "REPLY",
-            PleadingType.AFFIDAVIT: "AFFIDAVIT",
-            PleadingType.APPLICATION: "APPLICATION FOR RELIEF"
-        }
-        title = title_map.get(pleading_type, "LEGAL PLEADING")
+        title = _TITLE_MAP.get(pleading_type, "LEGAL PLEADING")
         
         # Build preamble
         preamble = f"""TO THE HONOURABLE COURT:
@@ -376,29 +627,6 @@ Please be advised that:
 
 The Plaintiff/Applicant by their Solicitors, {metadata.plaintiff.lawyer or 'hereinafter identified'}, respectfully submits this {title} in the matter above."""
         
-        # Generate detailed facts and contentions using LLM if needed
-        facts_numbered = facts
-        contentions_numbered = legal_basis
-        
-        if use_llm:
-            # Use LLM to expand and refine facts
-            facts_prompt = f"""Based on these facts, generate 5-7 detailed numbered factual paragraphs suitable for a {pleading_type.value.replace('_', ' ')} in Ghana courts:
-
-Facts: {', '.join(facts)}
-
-Format as numbered paragraphs (1. ... 2. ..., etc):"""
-            
-            try:
-                facts_response = self.llm.generate(
-                    facts_prompt,
-                    task_type=TaskType.PLEADING_DRAFTING
-                )
-                # Parse LLM response into numbered facts
-                facts_text = facts_response.text
-                facts_numbered = [f.strip() for f in facts_text.split('\n') if f.strip() and any(c.isdigit() for c in f[:3])]
-            except:
-                facts_numbered = facts
-        
         # Build pleading object
         pleading = Pleading(
             pleading_type=pleading_type,
@@ -409,24 +637,116 @@ Format as numbered paragraphs (1. ... 2. ..., etc):"""
             facts=facts_numbered,
             legal_contentions=contentions_numbered,
             relief_sought=relief_sought,
-            conclusion=f"WHEREFORE the {self._get_party_title(pleading_type, True)} prays the Court for the above relief."
+            conclusion=f"WHEREFORE the {self._get_party_title(pleading_type, True)} prays the Court for the above relief.",
+            generated_date=generated_date or datetime.now().isoformat()
         )
         
-        # Add citations if available
-        all_authorities = []
-        for contention in contentions_numbered:
-            citations = self.citation_network.extract_citations(contention)
-            for citation in citations:
-                all_authorities.append({
-                    'citation': citation.citation,
-                    'name': citation.case_name,
-                    'relationship': citation.relationship.value if citation.relationship else 'cited'
-                })
-        
-        pleading.citations = all_authorities[:10]  # Top 10 citations
+        # Add citations if available (one scan over all contentions, top 10)
+        pleading.citations = [
+            {
+                'citation': citation.citation,
+                'name': citation.case_name or citation.citation,
+                'relationship': citation.relationship.value if citation.relationship else 'cited'
+            }
+            for citations in self.citation_network.extract_citations_batch(contentions_numbered, limit=10)
+            for citation in citations
+        ]
         
         return pleading
 
+    def _expand_facts_cached(self, pleading_type: PleadingType, court: CourtType, facts: List[str]) -> List[str]:
+        """Expand facts, reusing the expansion of a repeated fact set when available"""
+        context = (pleading_type, court)
+        text = "\n".join(facts)
+        vec, expanded = self._reused_expansion(context, text)
+        if expanded is None:
+            expanded = self._expand_facts_uncached(pleading_type, tuple(facts))
+            self._facts_cache.insert(context, text, vec, expanded)
+        return list(expanded)
+
+    async def _aexpand_facts_cached(self, pleading_type: PleadingType, court: CourtType, facts: List[str]) -> List[str]:
+        """Async variant of _expand_facts_cached()"""
+        context = (pleading_type, court)
+        text = "\n".join(facts)
+        vec = None
+        expanded = self._facts_cache.get(context, text)
+        if expanded is None and self._facts_cache.semantic:
+            # Legal-BERT encoding (and its first-use model load) blocks, so it
+            # runs in a worker thread to keep concurrent pleadings moving
+            vec = await asyncio.to_thread(self._facts_cache.embed, text)
+            if vec is not None:
+                expanded = self._facts_cache.similar(context, text, vec)
+        if expanded is None:
+            facts_response = await self.llm.agenerate(
+                self._facts_prompt(facts),
+                task_type=TaskType.PLEADING_DRAFTING,
+                system=SYSTEM_PROMPT_FACTS[pleading_type]
+            )
+            expanded = self._parse_numbered_facts(facts_response.text)
+            self._facts_cache.insert(context, text, vec, expanded)
+        return list(expanded)
+
+    def _reused_expansion(
+        self,
+        context: Tuple[PleadingType, CourtType],
+        text: str
+    ) -> Tuple[Optional[np.ndarray], Optional[Tuple[str, ...]]]:
+        """
+        Look up a cached expansion for a fact set
+
+        Exact repeats are checked first, so they never pay for an embedding.
+
+        Returns:
+            (embedding of the fact set or None, cached expansion or None)
+        """
+        expanded = self._facts_cache.get(context, text)
+        if expanded is not None:
+            return None, expanded
+        vec = self._facts_cache.embed(text)
+        if vec is None:
+            return None, None
+        return vec, self._facts_cache.similar(context, text, vec)
+
+    def _expand_facts_uncached(self, pleading_type: PleadingType, facts: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Expand facts into numbered paragraphs; reuse is left to _expand_facts_cached()"""
+        # Parse paragraphs as they stream in rather than after the full response
+        chunks = self.llm.generate_stream(
+            self._facts_prompt(facts),
+            task_type=TaskType.PLEADING_DRAFTING,
+            system=SYSTEM_PROMPT_FACTS[pleading_type]
+        )
+        return tuple(self._iter_numbered_facts(chunks))
+
+    @staticmethod
+    def _facts_prompt(facts: Sequence[str]) -> str:
+        """User message for fact expansion; instructions live in the system prompt"""
+        return f"Facts: {', '.join(facts)}"
+
+    @classmethod
+    def _parse_numbered_facts(cls, facts_text: str) -> Tuple[str, ...]:
+        """Parse LLM response into numbered facts"""
+        return tuple(cls._iter_numbered_facts((facts_text,)))
+
+    @staticmethod
+    def _iter_numbered_facts(chunks: Iterable[str]) -> Iterator[str]:
+        """Yield each numbered fact line as soon as it is complete"""
+        pending: List[str] = []  # Pieces of the current, unfinished line
+        for chunk in chunks:
+            if '\n' not in chunk:
+                pending.append(chunk)
+                continue
+            head, *lines, tail = chunk.split('\n')
+            pending.append(head)
+            lines.insert(0, "".join(pending))
+            pending = [tail]
+            for f in lines:
+                if _NUMBERED_RE.search(f, 0, 3):
+                    yield f.strip()
+        
+        f = "".join(pending)
+        if _NUMBERED_RE.search(f, 0, 3):
+            yield f.strip()
+
     def generate_summons(
         self,
         metadata: PleadingMetadata,
@@ -497,7 +817,7 @@ Format as numbered paragraphs (1. ... 2. ..., etc):"""
         )
         
         # Customize for affidavit
-        numbered_statements = "\n\n".join([f"{i}. {s}" for i, s in enumerate(statements, 1)])
+        numbered_statements = "\n\n".join(f"{i}. {s}" for i, s in enumerate(statements, 1))
         pleading.verification = f"""I, {deponent_name}, of {deponent_address}, make oath and state as follows:
 
 {numbered_statements}
@@ -528,38 +848,68 @@ AND I make this solemn affidavit conscientiously believing the same to be true."
 
     def batch_generate(
         self,
-        pleading_requests: List[Dict[str, Any]]
+        pleading_requests: List[Dict[str, Any]],
+        concurrency_limit: int = BATCH_CONCURRENCY,
+        bulk_timestamp: bool = True
     ) -> List[Pleading]:
         """Generate multiple pleadings"""
-        pleadings = []
-        for request in pleading_requests:
-            try:
-                pleading_type = PleadingType[request.get('type', 'STATEMENT_OF_CLAIM').upper()]
-                pleading = self.generate_pleading(
-                    pleading_type=pleading_type,
-                    metadata=request.get('metadata'),
-                    facts=request.get('facts', []),
-                    legal_basis=request.get('legal_basis', []),
-                    relief_sought=request.get('relief', [])
-                )
-                pleadings.append(pleading)
-            except Exception as e:
-                print(f"Error generating pleading: {e}")
-                continue
+        batch = self.abatch_generate(pleading_requests, concurrency_limit, bulk_timestamp)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(batch)
+        # Called from async code (e.g. a FastAPI handler): asyncio.run() would
+        # raise here, so run the batch on its own loop in a worker thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, batch).result()
+
+    async def abatch_generate(
+        self,
+        pleading_requests: List[Dict[str, Any]],
+        concurrency_limit: int = BATCH_CONCURRENCY,
+        bulk_timestamp: bool = True
+    ) -> List[Pleading]:
+        """Generate multiple pleadings concurrently, in request order"""
+        # Bound in-flight LLM calls to respect provider rate limits
+        semaphore = asyncio.Semaphore(concurrency_limit)
+        # One timestamp for the whole batch unless each needs its own
+        generated_date = datetime.now().isoformat() if bulk_timestamp else None
+        
+        async def generate_one(request: Dict[str, Any]) -> Optional[Pleading]:
+            async with semaphore:
+                try:
+                    pleading_type = PleadingType[request.get('type', 'STATEMENT_OF_CLAIM').upper()]
+                    return await self.agenerate_pleading(
+                        pleading_type=pleading_type,
+                        metadata=request.get('metadata'),
+                        facts=request.get('facts', []),
+                        legal_basis=request.get('legal_basis', []),
+                        relief_sought=request.get('relief', []),
+                        generated_date=generated_date
+                    )
+                except Exception as e:
+                    logger.error("Error generating pleading: %s", e)
+                    return None
         
-        return pleadings
+        pleadings = await asyncio.gather(*(generate_one(request) for request in pleading_requests))
+        return [pleading for pleading in pleadings if pleading is not None]
 
 
 # Global instance
 _assistant: Optional[PleadingsAssistant] = None
+_assistant_lock = threading.Lock()
 
 
 def get_pleadings_assistant() -> PleadingsAssistant:
     """Get or create pleadings assistant singleton"""
     global _assistant
-    if _assistant is None:
-        _assistant = PleadingsAssistant()
-    return _assistant
+    # Double-checked locking: the hot path is a single lock-free read
+    if _assistant is not None:
+        return _assistant
+    with _assistant_lock:
+        if _assistant is None:
+            _assistant = PleadingsAssistant()
+        return _assistant
 
 
 if __name__ == "__main__":
@@ -13,29 +13,134 @@ Features:
 """
 
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+import functools
 import json
+import operator
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 from intelligence.citation_network import get_citation_network, CitationRelationship
 from intelligence.concept_extractor import get_concept_extractor
 from utils.legal_taxonomy import get_taxonomy
 
 
-@dataclass
+# Databases at least this large are indexed by a pool of worker processes
+PARALLEL_INDEX_MIN_CASES = 2000
+
+# Case texts whose lowercased copy and taxonomy-term hits are kept, LRU
+TEXT_CACHE_SIZE = 8192
+
+# Conclusion markers that usually introduce the court's holding, in order of
+# preference: a marker anywhere in the text beats every marker after it
+_HOLDING_MARKERS = ("in the result", "in conclusion", "we hold", "we find")
+_HOLDING_RE = re.compile("|".join(
+    f"(?P<marker{i}>{re.escape(marker)})" for i, marker in enumerate(_HOLDING_MARKERS)
+))
+
+# Commonly used legal terms reported as themes. Matched as substrings, so
+# "courts" and "lawful" count towards "court" and "law".
+_THEME_RE = re.compile(
+    r'duty|liability|damages|breach|contract|property|rights|obligation|party|court'
+    r'|principle|law|statute|equity|justice'
+)
+
+# Candidate distinguishing terms: words of eight or more letters, minus
+# vocabulary every judgment shares
+_WORD_RE = re.compile(r'[A-Za-z]{8,}')
+_FACTOR_STOP_WORDS = frozenset({"contract", "judgment", "plaintiff", "defendant"})
+
+# How a case relates to the one before it in a timeline, in order of
+# precedence when it cites the earlier case in more than one way
+_REL_LABEL = {
+    CitationRelationship.AFFIRMED: "affirmed previous holding",
+    CitationRelationship.OVERRULED: "overruled/reversed previous holding",
+    CitationRelationship.DISTINGUISHED: "distinguished from previous case",
+}
+
+
+def _extract_holding(text: str, text_lower: Optional[str] = None) -> str:
+    """Extract main holding from judgment text"""
+    if text_lower is None:
+        text_lower = text.lower()
+    # Look for conclusion section: the first occurrence of the most
+    # preferred marker present, found in a single scan of the text
+    best = None
+    for match in _HOLDING_RE.finditer(text_lower):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    if best is not None:
+        idx = best.start()
+        return text[idx:idx+300].strip()
+    return text[:200].strip()
+
+
+def _extract_key_passage(text: str, concept: str, text_lower: Optional[str] = None) -> str:
+    """Extract key passage discussing a concept"""
+    concept_lower = concept.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    idx = text_lower.find(concept_lower)
+    if idx != -1:
+        start = max(0, idx - 100)
+        end = min(len(text), idx + 300)
+        return text[start:end].strip()
+    return ""
+
+
+@dataclass(slots=True, frozen=True)
 class PrecedentCaseInfo:
-    """Information about a precedent case"""
+    """
+    Information about a precedent case
+
+    holding and key_extract are extracted from full_text on first access
+    and then kept, so cases that are only listed never pay for them.
+    """
     case_id: str
     case_name: str
     date_decided: str
     court: str
     judges: List[str]
-    holding: str
-    key_extract: str
     status: str  # "good law", "overruled", etc.
+    sort_key: int = 0  # date_decided as YYYYMMDD, for ordering
+    full_text: str = field(default="", repr=False)
+    concept: str = ""  # Concept the key extract is taken around
+    text_lower: Optional[str] = field(default=None, repr=False, compare=False)
+    _holding: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _key_extract: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def holding(self) -> str:
+        if self._holding is None:
+            object.__setattr__(self, '_holding', _extract_holding(self.full_text, self.text_lower))
+        return self._holding
+
+    @property
+    def key_extract(self) -> str:
+        if self._key_extract is None:
+            object.__setattr__(
+                self, '_key_extract',
+                _extract_key_passage(self.full_text, self.concept, self.text_lower)
+            )
+        return self._key_extract
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrecedentTimeline:
     """Timeline showing evolution of a legal principle"""
     concept: str
@@ -45,7 +150,7 @@ class PrecedentTimeline:
     conflicts: List[Dict]  # Conflicting decisions
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PrecedentMatrix:
     """Matrix for comparing precedents"""
     concept: str
@@ -64,6 +169,171 @@ class PrecedentAnalyzer:
         self.citation_network = get_citation_network()
         self.concept_extractor = get_concept_extractor()
         self.taxonomy = get_taxonomy()
+        self._concept_automaton = self._build_concept_automaton()
+        # Keyed by the text itself rather than case_id, so an edited case is
+        # re-read instead of served stale; Python caches each str's hash
+        self._lower_text = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(str.lower)
+        self._text_terms = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(self._text_terms_uncached)
+        # Statuses as of citation network version _status_version
+        self._status_cache: Dict[str, str] = {}
+        self._status_version = self.citation_network.version
+        # (database fingerprint, ...) of the database each index was built from
+        self._year_index: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+        self._concept_index: Optional[Tuple[int, Dict[str, np.ndarray]]] = None
+
+    def _build_concept_automaton(self):
+        """Build one automaton over every taxonomy name and alias"""
+        if not HAS_AHOCORASICK:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term, concept_id in self.taxonomy.alias_map.items():
+            automaton.add_word(term, (concept_id, term))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _fingerprint(case_database: List[Dict]) -> int:
+        """
+        Hash of the ids, dates and texts of a database's cases
+
+        The indexes are keyed on this, so editing a case in place is noticed.
+        String hashes are cached by Python, so this is one pass over the
+        cases, not over their texts.
+        """
+        return hash(tuple(
+            (case.get('case_id'), case.get('date_decided'), case.get('full_text'))
+            for case in case_database
+        ))
+
+    def _case_years(self, case_database: List[Dict], fingerprint: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Decision year of every case as an int16 array, plus a mask of the
+        cases whose date_decided starts with a readable year.
+
+        Built once per database and rebuilt when its cases change.
+        """
+        if fingerprint is None:
+            fingerprint = self._fingerprint(case_database)
+        index = self._year_index
+        if index is not None and index[0] == fingerprint:
+            return index[1], index[2]
+
+        parsed = []
+        for case in case_database:
+            try:
+                parsed.append(int(case.get('date_decided', '')[:4]))
+            except (ValueError, TypeError):
+                parsed.append(None)
+
+        years = np.array([0 if y is None else y for y in parsed], dtype=np.int16)
+        valid = np.array([y is not None for y in parsed], dtype=bool)
+        self._year_index = (fingerprint, years, valid)
+        return years, valid
+
+    @staticmethod
+    def _month_day(date_decided: str) -> int:
+        """MMDD part of an ISO-style date as an int (missing parts count as 0)"""
+        month, day = date_decided[5:7], date_decided[8:10]
+        return (int(month) if month.isdecimal() else 0) * 100 + (int(day) if day.isdecimal() else 0)
+
+    def _lower(self, case: Dict) -> str:
+        """Lowercased full_text of a case, memoized per text in __init__"""
+        return self._lower_text(case.get('full_text', ''))
+
+    def _mentions(self, case: Dict, concept_lower: str) -> bool:
+        """Whether a case's text contains a (lowercased) taxonomy term"""
+        if self._concept_automaton is not None:
+            return concept_lower in self._case_terms(case)
+        return concept_lower in self._lower(case)
+
+    def _case_terms(self, case: Dict) -> set:
+        """
+        Taxonomy terms (lowercased names and aliases) mentioned in a case.
+
+        The case text is scanned once for every term and the hits are kept
+        per text, so later queries for other concepts are set lookups.
+        """
+        return self._text_terms(self._lower(case))
+
+    def _text_terms_uncached(self, text_lower: str) -> frozenset:
+        """Taxonomy terms in a lowercased text; memoized per text in __init__"""
+        return frozenset(term for _, (_, term) in self._concept_automaton.iter(text_lower))
+
+    def build_index(self, case_database: List[Dict], max_workers: Optional[int] = None):
+        """
+        Index which taxonomy terms every case mentions
+        
+        Scans the whole database once. Until a database with different
+        cases is passed in, find_precedent_cases then looks concepts up
+        in the index instead of checking each case's text. Databases of
+        PARALLEL_INDEX_MIN_CASES or more are scanned by a process pool.
+        
+        Args:
+            case_database: List of case dictionaries from database
+            max_workers: Worker processes to use (default: one per CPU)
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if (self._concept_automaton is not None and workers > 1 and
+                len(case_database) >= PARALLEL_INDEX_MIN_CASES):
+            case_terms = self._scan_cases_parallel(case_database, workers)
+        elif self._concept_automaton is not None:
+            case_terms = map(self._case_terms, case_database)
+        else:
+            case_terms = (
+                [term for term in self.taxonomy.alias_map if term in self._lower(case)]
+                for case in case_database
+            )
+        
+        postings = defaultdict(list)
+        for i, terms in enumerate(case_terms):
+            for term in terms:
+                postings[term].append(i)
+        
+        index = {term: np.array(ids, dtype=np.intp) for term, ids in postings.items()}
+        self._concept_index = (self._fingerprint(case_database), index)
+
+    def _scan_cases_parallel(self, case_database: List[Dict], workers: int) -> List[set]:
+        """
+        Run the concept automaton over every case across worker processes.
+        
+        The lowercased texts are laid end to end, UTF-8 encoded, in one
+        shared memory block. Each worker attaches to it, builds its own
+        automaton and scans a contiguous span of cases by byte offset, so
+        the corpus is never pickled.
+        """
+        encoded = [self._lower(case).encode() for case in case_database]
+        offsets = [0]
+        for text in encoded:
+            offsets.append(offsets[-1] + len(text))
+
+        corpus = shared_memory.SharedMemory(create=True, size=max(offsets[-1], 1))
+        try:
+            for i, text in enumerate(encoded):
+                corpus.buf[offsets[i]:offsets[i + 1]] = text
+            # The shared block now holds the only copy the workers need
+            del encoded
+
+            # A few spans per worker keeps the pool busy when sizes vary
+            step = -(-len(case_database) // (workers * 4))
+            spans = [(start, min(start + step, len(case_database)))
+                     for start in range(0, len(case_database), step)]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_scan_worker,
+                initargs=(corpus.name, list(self.taxonomy.alias_map), offsets)
+            ) as executor:
+                return [hits for span_hits in executor.map(_scan_span, spans)
+                        for hits in span_hits]
+        finally:
+            corpus.close()
+            corpus.unlink()
+
+    def _indexed_cases(self, fingerprint: int, concept_lower: str) -> Optional[np.ndarray]:
+        """Positions of the cases mentioning a concept, if the database with this fingerprint is indexed"""
+        index = self._concept_index
+        if index is None or index[0] != fingerprint:
+            return None
+        return index[1].get(concept_lower, np.empty(0, dtype=np.intp))
 
     def find_precedent_cases(
         self,
@@ -82,7 +352,7 @@ class PrecedentAnalyzer:
             max_year: Maximum year to include
             
         Returns:
-            List of precedent cases discussing the concept
+            List of precedent cases discussing the concept, oldest first
         """
         relevant_cases = []
         
@@ -91,31 +361,43 @@ class PrecedentAnalyzer:
         if not found_concept:
             return []
         
-        for case in case_database:
+        fingerprint = self._fingerprint(case_database)
+        years, valid = self._case_years(case_database, fingerprint)
+        in_range = valid & (years >= min_year) & (years <= max_year)
+
+        concept_lower = concept.lower()
+        indexed = self._indexed_cases(fingerprint, concept_lower)
+        if indexed is not None:
+            # Every indexed case mentions the concept, only dates remain
+            candidates = indexed[in_range[indexed]]
+        else:
+            candidates = np.flatnonzero(in_range)
+
+        for i in candidates:
+            case = case_database[i]
             # Check if case text contains concept
-            case_text = case.get('full_text', '').lower()
-            concept_lower = concept.lower()
+            if indexed is None and not self._mentions(case, concept_lower):
+                continue
             
-            if concept_lower in case_text:
-                # Extract year from case
-                try:
-                    case_year = int(case.get('date_decided', '')[:4])
-                    if min_year <= case_year <= max_year:
-                        relevant_cases.append(PrecedentCaseInfo(
-                            case_id=case.get('case_id'),
-                            case_name=case.get('case_name'),
-                            date_decided=case.get('date_decided'),
-                            court=case.get('court', 'Supreme Court'),
-                            judges=case.get('judges', []),
-                            holding=self._extract_holding(case.get('full_text', '')),
-                            key_extract=self._extract_key_passage(case.get('full_text', ''), concept),
-                            status=self._determine_case_status(case.get('case_id'))
-                        ))
-                except (ValueError, TypeError):
-                    pass
-        
-        # Sort by date
-        relevant_cases.sort(key=lambda x: x.date_decided, reverse=True)
+            court = case.get('court', 'Supreme Court')
+            if isinstance(court, str):
+                court = sys.intern(court)
+            
+            relevant_cases.append(PrecedentCaseInfo(
+                case_id=case.get('case_id'),
+                case_name=case.get('case_name'),
+                date_decided=case.get('date_decided'),
+                court=court,
+                judges=case.get('judges', []),
+                status=self._determine_case_status(case.get('case_id')),
+                sort_key=int(years[i]) * 10000 + self._month_day(case.get('date_decided')),
+                full_text=case.get('full_text', ''),
+                concept=concept,
+                text_lower=self._lower(case)
+            ))
+        
+        # Sort by date ascending (oldest to newest)
+        relevant_cases.sort(key=operator.attrgetter('sort_key'))
         return relevant_cases
 
     def analyze_principle_evolution(
@@ -128,42 +410,61 @@ class PrecedentAnalyzer:
         
         Args:
             concept: Legal concept
-            precedent_cases: List of relevant precedent cases
+            precedent_cases: List of relevant precedent cases, oldest first
+                (as returned by find_precedent_cases)
             
         Returns:
             PrecedentTimeline showing evolution
         """
-        # Sort by date ascending (oldest to newest)
-        sorted_cases = sorted(precedent_cases, key=lambda x: x.date_decided)
+        sorted_cases = precedent_cases
         
         if not sorted_cases:
             return None
         
-        evolution_steps = []
-        for i, case in enumerate(sorted_cases):
-            step = {
-                "year": case.date_decided[:4],
-                "case": case.case_name,
-                "case_id": case.case_id,
-                "holding": case.holding,
-                "judges": case.judges,
-            }
-            
-            if i > 0:
-                prev_case = sorted_cases[i-1]
-                # Determine relationship
-                citing_rels = self.citation_network.find_cited_cases(case.case_id)
-                if prev_case.case_id in citing_rels.get(CitationRelationship.AFFIRMED, []):
-                    step["relationship_to_prior"] = "affirmed previous holding"
-                elif prev_case.case_id in citing_rels.get(CitationRelationship.OVERRULED, []):
-                    step["relationship_to_prior"] = "overruled/reversed previous holding"
-                elif prev_case.case_id in citing_rels.get(CitationRelationship.DISTINGUISHED, []):
-                    step["relationship_to_prior"] = "distinguished from previous case"
-                else:
-                    step["relationship_to_prior"] = "no direct relationship"
-            
-            evolution_steps.append(step)
+        cited_by_case = self.citation_network.find_cited_cases_bulk(
+            case.case_id for case in sorted_cases[1:]
+        )
+        
+        evolution_steps = [
+            self._evolution_step(case, sorted_cases[i - 1] if i > 0 else None, cited_by_case)
+            for i, case in enumerate(sorted_cases)
+        ]
+        return self._timeline(concept, sorted_cases, evolution_steps)
+
+    def _evolution_step(
+        self,
+        case: PrecedentCaseInfo,
+        prev_case: Optional[PrecedentCaseInfo],
+        cited_by_case: Dict[str, Dict[CitationRelationship, List[str]]]
+    ) -> Dict:
+        """One timeline entry, relating a case to the one decided before it"""
+        step = {
+            "year": case.date_decided[:4],
+            "case": case.case_name,
+            "case_id": case.case_id,
+            "holding": case.holding,
+            "judges": case.judges,
+        }
         
+        if prev_case is not None:
+            # Determine relationship
+            citing_rels = cited_by_case[case.case_id]
+            rel_by_target = {}
+            for rel in _REL_LABEL:
+                for target_id in citing_rels.get(rel, ()):
+                    rel_by_target.setdefault(target_id, rel)
+            rel = rel_by_target.get(prev_case.case_id)
+            step["relationship_to_prior"] = _REL_LABEL[rel] if rel else "no direct relationship"
+        
+        return step
+
+    def _timeline(
+        self,
+        concept: str,
+        sorted_cases: List[PrecedentCaseInfo],
+        evolution_steps: List[Dict]
+    ) -> PrecedentTimeline:
+        """Assemble a timeline from its oldest-first cases and steps"""
         # Determine current state
         current_case = sorted_cases[-1]
         current_state = f"{concept} in Ghana law is established by {current_case.case_name} ({current_case.date_decided[:4]}). "
@@ -233,13 +534,12 @@ class PrecedentAnalyzer:
         if not precedent_cases:
             return {"error": f"No precedents found for '{concept}'"}
         
-        timeline = self.analyze_principle_evolution(concept, precedent_cases)
-        matrix = self.create_precedent_matrix(concept, precedent_cases)
+        timeline, matrix = self._build_analysis(concept, precedent_cases)
         
         return {
             "concept": concept,
             "total_precedents": len(precedent_cases),
-            "date_range": f"{precedent_cases[-1].date_decided} to {precedent_cases[0].date_decided}",
+            "date_range": f"{precedent_cases[0].date_decided} to {precedent_cases[-1].date_decided}",
             "timeline": {
                 "initial_case": {
                     "name": timeline.initial_case.case_name,
@@ -265,84 +565,115 @@ class PrecedentAnalyzer:
             "analysis_summary": self._generate_summary(concept, precedent_cases, timeline),
         }
 
-    def _extract_holding(self, text: str) -> str:
-        """Extract main holding from judgment text"""
-        # Look for conclusion section
-        conclusion_markers = ["In the result", "In conclusion", "We hold", "We find"]
-        for marker in conclusion_markers:
-            if marker.lower() in text.lower():
-                idx = text.lower().find(marker.lower())
-                return text[idx:idx+300].strip()
-        return text[:200].strip()
-
-    def _extract_key_passage(self, text: str, concept: str) -> str:
-        """Extract key passage discussing a concept"""
-        concept_lower = concept.lower()
-        idx = text.lower().find(concept_lower)
-        if idx != -1:
-            start = max(0, idx - 100)
-            end = min(len(text), idx + 300)
-            return text[start:end].strip()
-        return ""
+    def _build_analysis(
+        self,
+        concept: str,
+        cases_sorted_asc: List[PrecedentCaseInfo]
+    ) -> Tuple[PrecedentTimeline, PrecedentMatrix]:
+        """
+        Build the timeline and the comparison matrix in one pass
+        
+        Equivalent to analyze_principle_evolution followed by
+        create_precedent_matrix on the newest-first cases, but walks the
+        cases once. The walk goes newest first, the order the matrix lists
+        them in, and the timeline steps are reversed at the end.
+        cases_sorted_asc must not be empty; the report returns its
+        no-precedents error before getting here.
+        """
+        cited_by_case = self.citation_network.find_cited_cases_bulk(
+            case.case_id for case in cases_sorted_asc[1:]
+        )
+        
+        evolution_steps = []
+        holdings = {}
+        themes = set()
+        factors = Counter()
+        for i in range(len(cases_sorted_asc) - 1, -1, -1):
+            case = cases_sorted_asc[i]
+            prev_case = cases_sorted_asc[i - 1] if i > 0 else None
+            evolution_steps.append(self._evolution_step(case, prev_case, cited_by_case))
+            holdings[case.case_id] = case.holding
+            themes.update(self._case_themes(case))
+            factors.update(self._factor_words(case))
+        evolution_steps.reverse()
+        
+        timeline = self._timeline(concept, cases_sorted_asc, evolution_steps)
+        matrix = PrecedentMatrix(
+            concept=concept,
+            cases=cases_sorted_asc[::-1],
+            holdings=holdings,
+            distinguishing_factors=[word for word, _ in factors.most_common(10)],
+            common_themes=list(themes)
+        )
+        return timeline, matrix
 
     def _determine_case_status(self, case_id: str) -> str:
         """Determine current status of a case"""
-        try:
-            status = self.citation_network.get_case_status(case_id)
-            return status.current_status
-        except:
-            return "good law"
+        if self.citation_network.version != self._status_version:
+            # Citations were added or imported since these were resolved
+            self._status_cache.clear()
+            self._status_version = self.citation_network.version
+        status = self._status_cache.get(case_id)
+        if status is not None:
+            return status
+        # get_case_status answers for any case id ("unknown" when uncited),
+        # so only a missing result needs a default
+        result = self.citation_network.get_case_status(case_id)
+        status = result.current_status if result is not None else "good law"
+        # Interned so the summary's status comparisons hit the identity fast path
+        status = sys.intern(status)
+        self._status_cache[case_id] = status
+        return status
 
     def _find_conflicting_decisions(self, cases: List[PrecedentCaseInfo]) -> List[Dict]:
         """Find conflicting decisions in precedent"""
-        conflicts = []
+        if len(cases) < 2:
+            return []
         
-        # Compare holdings
-        for i in range(len(cases) - 1):
-            case1 = cases[i]
-            case2 = cases[i + 1]
-            
-            # Simple conflict detection: if one was overruled
-            if "not" in case2.holding.lower() and "not" not in case1.holding.lower():
-                conflicts.append({
-                    "between": f"{case1.case_name} and {case2.case_name}",
-                    "type": "possible reversal",
-                })
+        # Simple conflict detection: a negated holding following one that
+        # was not negated, i.e. a 0 -> 1 step in the negation mask
+        holdings = np.array([case.holding.lower() for case in cases])
+        negated = np.char.find(holdings, "not") >= 0
+        transitions = np.flatnonzero(np.diff(negated.astype(np.int8)) == 1)
         
-        return conflicts
+        return [
+            {
+                "between": f"{cases[i].case_name} and {cases[i + 1].case_name}",
+                "type": "possible reversal",
+            }
+            for i in transitions
+        ]
 
     def _extract_distinguishing_factors(self, cases: List[PrecedentCaseInfo]) -> List[str]:
         """Extract factors that distinguish cases"""
-        factors = set()
+        factors = Counter()
         
-        # Extract unique elements from each case
+        # Rank uncommon terms by how often they appear across the extracts
         for case in cases:
-            words = case.key_extract.split()
-            # Get uncommon terms
-            for word in words:
-                if len(word) > 7 and word not in ["contract", "judgment", "plaintiff", "defendant"]:
-                    factors.add(word)
+            factors.update(self._factor_words(case))
         
-        return list(factors)[:10]
+        return [word for word, _ in factors.most_common(10)]
+
+    @staticmethod
+    def _factor_words(case: PrecedentCaseInfo) -> List[str]:
+        """Candidate distinguishing terms in a case's key extract"""
+        words = (word.lower() for word in _WORD_RE.findall(case.key_extract))
+        return [word for word in words if word not in _FACTOR_STOP_WORDS]
 
     def _find_common_themes(self, cases: List[PrecedentCaseInfo]) -> List[str]:
         """Find common themes across cases"""
         themes = set()
         
         for case in cases:
-            # Extract commonly used legal terms
-            text = case.key_extract.lower()
-            common_terms = [
-                "duty", "liability", "damages", "breach", "contract",
-                "property", "rights", "obligation", "party", "court",
-                "principle", "law", "statute", "equity", "justice"
-            ]
-            for term in common_terms:
-                if term in text:
-                    themes.add(term)
+            themes.update(self._case_themes(case))
         
         return list(themes)
 
+    @staticmethod
+    def _case_themes(case: PrecedentCaseInfo) -> List[str]:
+        """Commonly used legal terms in a case's key extract"""
+        return _THEME_RE.findall(case.key_extract.lower())
+
     def _generate_summary(self, concept: str, cases: List[PrecedentCaseInfo], timeline: PrecedentTimeline) -> str:
         """Generate text summary of precedent analysis"""
         summary = f"Precedent Analysis for {concept}:\n\n"
@@ -360,6 +691,35 @@ class PrecedentAnalyzer:
         return summary
 
 
+# Worker-process state for PrecedentAnalyzer._scan_cases_parallel
+_scan_automaton = None
+_scan_corpus = None
+_scan_offsets = None
+
+
+def _init_scan_worker(corpus_name: str, terms: List[str], offsets: List[int]):
+    """Attach to the shared corpus and build this worker's automaton"""
+    global _scan_automaton, _scan_corpus, _scan_offsets
+    _scan_automaton = ahocorasick.Automaton()
+    for term in terms:
+        _scan_automaton.add_word(term, term)
+    _scan_automaton.make_automaton()
+    _scan_corpus = shared_memory.SharedMemory(name=corpus_name)
+    _scan_offsets = offsets
+
+
+def _scan_span(span: Tuple[int, int]) -> List[set]:
+    """Taxonomy terms mentioned by each case in [start, end)"""
+    start, end = span
+    buf = _scan_corpus.buf
+    return [
+        {term for _, term in _scan_automaton.iter(
+            bytes(buf[_scan_offsets[i]:_scan_offsets[i + 1]]).decode()
+        )}
+        for i in range(start, end)
+    ]
+
+
 # Global instance
 _precedent_analyzer = None
 
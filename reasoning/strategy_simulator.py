@@ -13,11 +13,32 @@ Features:
 """
 
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+import functools
+from itertools import repeat
 import json
 import math
+import re
+import sys
+from bisect import bisect_right
+
+import numpy as np
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from reasoning.llm_integration import (
     get_llm_orchestrator,
@@ -27,6 +48,34 @@ from reasoning.precedent_analyzer import get_precedent_analyzer
 from intelligence.citation_network import get_citation_network, CitationRelationship
 
 
+# Weight of a precedent by the authority of the deciding court
+_AUTHORITY_MULT = {
+    "binding": 1.0,
+    "persuasive": 0.7,
+    "weak": 0.3
+}
+
+# Assessments remembered per (scenario content, budget), LRU
+ASSESSMENT_CACHE_SIZE = 1024
+
+# Specific, established causes of action that strengthen a legal position
+_STRONG_THEORIES = (
+    "breach of contract", "fiduciary duty", "fraud", "negligence",
+    "conversion", "trespass", "statutory violation"
+)
+
+if HAS_AHOCORASICK:
+    _THEORY_AC = ahocorasick.Automaton()
+    for _theory in _STRONG_THEORIES:
+        _THEORY_AC.add_word(_theory, _theory)
+    _THEORY_AC.make_automaton()
+else:
+    _THEORY_AC = None
+
+# Fallback matcher: one alternation, searched against the lowercased theory
+_STRONG_RE = re.compile("|".join(map(re.escape, _STRONG_THEORIES)))
+
+
 class OutcomeType(Enum):
     """Possible litigation outcomes"""
     PLAINTIFF_WIN = "plaintiff_win"
@@ -39,6 +88,16 @@ class OutcomeType(Enum):
     UNKNOWN = "unknown"
 
 
+# Predicted outcome by [client is defendant][strength band: strong, moderate, weak]
+_OUTCOME_TABLE = np.array([
+    [OutcomeType.JUDGMENT_ON_MERITS, OutcomeType.SETTLEMENT, OutcomeType.DISMISSAL],
+    [OutcomeType.DISMISSAL, OutcomeType.SETTLEMENT, OutcomeType.JUDGMENT_ON_MERITS],
+], dtype=object)
+
+# Settlement probability in the moderate band, by [client is defendant]
+_SETTLEMENT_PROB = np.array([0.7, 0.6])
+
+
 class RiskLevel(Enum):
     """Risk assessment levels"""
     VERY_LOW = "very_low"
@@ -49,7 +108,15 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# A score below _RISK_THRESHOLDS[i] (and not below any earlier one) is _RISK_LEVELS[i]
+_RISK_THRESHOLDS = (0.1, 0.25, 0.5, 0.75, 0.9)
+_RISK_LEVELS = (
+    RiskLevel.VERY_LOW, RiskLevel.LOW, RiskLevel.MODERATE,
+    RiskLevel.HIGH, RiskLevel.VERY_HIGH, RiskLevel.CRITICAL
+)
+
+
+@dataclass(slots=True)
 class RiskFactor:
     """Individual risk factor assessment"""
     name: str
@@ -59,12 +126,26 @@ class RiskFactor:
     mitigation: Optional[str] = None
     estimated_cost: float = 0.0
 
+    def __post_init__(self):
+        self.category = sys.intern(self.category)
+
     def calculate_risk_score(self) -> float:
         """Calculate risk score as impact × likelihood"""
         return self.impact * self.likelihood
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'name': self.name,
+            'category': self.category,
+            'impact': self.impact,
+            'likelihood': self.likelihood,
+            'mitigation': self.mitigation,
+            'estimated_cost': self.estimated_cost
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class PrecedentStrength:
     """Analysis of precedent support for position"""
     case_name: str
@@ -75,30 +156,25 @@ class PrecedentStrength:
     supporting_holding: bool
     distinguishable: bool
     distinguishing_factors: List[str] = field(default_factory=list)
+    # Authority x holding x distinguishability multiplier, fixed at construction
+    _strength_mult: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.authority_level = sys.intern(self.authority_level)
+        self._strength_mult = (
+            _AUTHORITY_MULT.get(self.authority_level, 0.5) *
+            (1.2 if self.supporting_holding else 0.8) *  # Supporting holding bonus
+            (0.6 if self.distinguishable else 1.0)  # Distinguishability penalty
+        )
 
     def calculate_strength_score(self) -> float:
         """Calculate overall strength"""
-        base = self.similarity_score
-        
-        # Authority multiplier
-        authority_mult = {
-            "binding": 1.0,
-            "persuasive": 0.7,
-            "weak": 0.3
-        }.get(self.authority_level, 0.5)
-        
-        # Supporting holding bonus
-        holding_mult = 1.2 if self.supporting_holding else 0.8
-        
-        # Distinguishability penalty
-        distinguish_mult = 0.6 if self.distinguishable else 1.0
-        
-        return base * authority_mult * holding_mult * distinguish_mult
+        return self.similarity_score * self._strength_mult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CostEstimate:
-    """Estimated litigation costs"""
+    """Estimated litigation costs (immutable, so the derived totals stay valid)"""
     attorney_fees: float  # Base hourly rate estimate
     court_filing_fees: float
     expert_witnesses: float
@@ -109,11 +185,13 @@ class CostEstimate:
     miscellaneous: float = 0.0
     duration_days: int = 365  # Estimated duration
     hourly_rate: float = 500.0  # Avg Ghana lawyer hourly rate
+    # Derived totals, computed once at construction
+    _total_cost: float = field(init=False, repr=False, compare=False)
+    _attorney_hours: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def total_cost(self) -> float:
-        """Calculate total estimated cost"""
-        return (
+    def __post_init__(self):
+        # Frozen: set the derived fields past the dataclass __setattr__ guard
+        object.__setattr__(self, '_total_cost', (
             self.attorney_fees +
             self.court_filing_fees +
             self.expert_witnesses +
@@ -122,12 +200,21 @@ class CostEstimate:
             self.trial_preparation +
             self.appeal_costs +
             self.miscellaneous
+        ))
+        object.__setattr__(
+            self, '_attorney_hours',
+            self.attorney_fees / self.hourly_rate if self.hourly_rate > 0 else 0
         )
 
+    @property
+    def total_cost(self) -> float:
+        """Calculate total estimated cost"""
+        return self._total_cost
+
     @property
     def attorney_hours_estimate(self) -> float:
         """Estimate total attorney hours"""
-        return self.attorney_fees / self.hourly_rate if self.hourly_rate > 0 else 0
+        return self._attorney_hours
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -140,13 +227,13 @@ class CostEstimate:
             'trial_preparation': self.trial_preparation,
             'appeal_costs': self.appeal_costs,
             'miscellaneous': self.miscellaneous,
-            'total_cost': self.total_cost,
+            'total_cost': self._total_cost,
             'duration_days': self.duration_days,
-            'attorney_hours_estimate': self.attorney_hours_estimate
+            'attorney_hours_estimate': self._attorney_hours
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OutcomePrediction:
     """Predicted litigation outcome"""
     primary_outcome: OutcomeType
@@ -158,9 +245,14 @@ class OutcomePrediction:
     timeline_estimate: int = 365  # Days to resolution
     likely_damages: Optional[float] = None  # If plaintiff win
     settlement_range: Tuple[float, float] = (0.0, 0.0)  # Min-max settlement
+    # primary_outcome.value, resolved once for serialization
+    _outcome_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._outcome_value = self.primary_outcome.value
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyAssessment:
     """Assessment of litigation strategy"""
     strategy_name: str
@@ -211,7 +303,7 @@ class StrategyAssessment:
             'procedural_readiness': self.procedural_readiness,
             'overall_score': self.overall_score,
             'predicted_outcome': {
-                'type': self.predicted_outcome.primary_outcome.value,
+                'type': self.predicted_outcome._outcome_value,
                 'probability': self.predicted_outcome.outcome_probability,
                 'confidence': self.predicted_outcome.confidence
             },
@@ -219,8 +311,14 @@ class StrategyAssessment:
             'recommendations': self.recommendations
         }
 
+    def to_json(self) -> str:
+        """Convert to JSON"""
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(self.to_dict(), indent=2)
+
 
-@dataclass
+@dataclass(slots=True)
 class LitigationScenario:
     """Scenario for analysis"""
     name: str
@@ -230,6 +328,9 @@ class LitigationScenario:
     opponent_strengths: List[str] = field(default_factory=list)
     opponent_weaknesses: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.client_position = sys.intern(self.client_position)
+
 
 class StrategySimulator:
     """Simulate and analyze litigation strategies"""
@@ -238,18 +339,63 @@ class StrategySimulator:
         self.llm = get_llm_orchestrator()
         self.precedent_analyzer = get_precedent_analyzer()
         self.citation_network = get_citation_network()
+        self._assessment_cache: "OrderedDict[Tuple, StrategyAssessment]" = OrderedDict()
+        # One precedent lookup per (theory or opponent strength, kind)
+        self._lookup_precedent = functools.lru_cache(maxsize=4096)(self._lookup_precedent_uncached)
+
+    @staticmethod
+    def _scenario_key(scenario: LitigationScenario, budget: float) -> Tuple:
+        """Content fingerprint of a scenario and budget for the assessment cache"""
+        return (
+            scenario.name,
+            scenario.client_position,
+            tuple(scenario.key_facts),
+            tuple(scenario.legal_theories),
+            tuple(scenario.opponent_strengths),
+            tuple(scenario.opponent_weaknesses),
+            budget,
+        )
+
+    def _cached_assessment(self, key: Tuple) -> Optional[StrategyAssessment]:
+        """Previously computed assessment for a fingerprint, if still cached"""
+        assessment = self._assessment_cache.get(key)
+        if assessment is not None:
+            self._assessment_cache.move_to_end(key)
+        return assessment
+
+    def _remember_assessment(self, key: Tuple, assessment: StrategyAssessment) -> None:
+        """Cache an assessment, evicting the least recently used one when full"""
+        self._assessment_cache[key] = assessment
+        self._assessment_cache.move_to_end(key)
+        if len(self._assessment_cache) > ASSESSMENT_CACHE_SIZE:
+            self._assessment_cache.popitem(last=False)
 
     def assess_strategy(
         self,
         scenario: LitigationScenario,
         budget: float = 50000.0
     ) -> StrategyAssessment:
-        """Assess overall litigation strategy"""
-        
-        # Build strategy name and description
-        strategy_name = f"{scenario.client_position.title()} Strategy"
-        strategy_desc = f"Position: {', '.join(scenario.legal_theories[:2])}"
-        
+        """
+        Assess overall litigation strategy
+        
+        Assessments are cached on the scenario's content and budget. A
+        repeat returns a copy of the cached assessment with a fresh
+        assessment_date; its nested lists and dicts are shared and should be
+        treated as read-only.
+        """
+        key = self._scenario_key(scenario, budget)
+        cached = self._cached_assessment(key)
+        if cached is None:
+            cached = self._assess_uncached(scenario, budget)
+            self._remember_assessment(key, cached)
+        return replace(cached, assessment_date=datetime.now().isoformat())
+
+    def _assess_uncached(
+        self,
+        scenario: LitigationScenario,
+        budget: float
+    ) -> StrategyAssessment:
+        """Run the full assessment pipeline for one scenario"""
         # Calculate legal strength based on theories
         legal_strength = self._assess_legal_strength(scenario.legal_theories)
         
@@ -260,9 +406,6 @@ class StrategySimulator:
             scenario.opponent_weaknesses
         )
         
-        # Procedural readiness (assume initial 0.7)
-        procedural_readiness = 0.7
-        
         # Predict outcome
         predicted_outcome = self.predict_outcome(
             scenario,
@@ -270,6 +413,32 @@ class StrategySimulator:
             factual_strength
         )
         
+        return self._build_assessment(
+            scenario, budget, legal_strength, factual_strength, predicted_outcome
+        )
+
+    def _build_assessment(
+        self,
+        scenario: LitigationScenario,
+        budget: float,
+        legal_strength: float,
+        factual_strength: float,
+        predicted_outcome: OutcomePrediction,
+        overall_score: Optional[float] = None
+    ) -> StrategyAssessment:
+        """
+        Complete an assessment once strengths and outcome are known
+        
+        overall_score may be passed in when it has already been computed,
+        as the batch path does; otherwise it is calculated here.
+        """
+        # Build strategy name and description
+        strategy_name = f"{scenario.client_position.title()} Strategy"
+        strategy_desc = f"Position: {', '.join(scenario.legal_theories[:2])}"
+        
+        # Procedural readiness (assume initial 0.7)
+        procedural_readiness = 0.7
+        
         # Risk assessment
         risk_assessment = self.assess_risks(scenario)
         
@@ -308,7 +477,10 @@ class StrategySimulator:
             recommendations=recommendations
         )
         
-        assessment.calculate_overall_score()
+        if overall_score is None:
+            assessment.calculate_overall_score()
+        else:
+            assessment.overall_score = overall_score
         return assessment
 
     def _assess_legal_strength(self, legal_theories: List[str]) -> float:
@@ -323,17 +495,27 @@ class StrategySimulator:
         score += min(0.2, len(legal_theories) * 0.05)
         
         # Specific, established theories = stronger
-        strong_theories = [
-            "breach of contract", "fiduciary duty", "fraud", "negligence",
-            "conversion", "trespass", "statutory violation"
-        ]
-        
-        for theory in legal_theories:
-            if any(st in theory.lower() for st in strong_theories):
-                score += 0.15
+        for _ in range(self._count_strong_theories(legal_theories)):
+            score += 0.15
         
         return min(1.0, score)
 
+    def _count_strong_theories(self, legal_theories: List[str]) -> int:
+        """Count theories naming a specific, established cause of action"""
+        if _THEORY_AC is None:
+            return sum(1 for theory in legal_theories if _STRONG_RE.search(theory.lower()))
+        
+        # One automaton pass over all theories; a theory counts once however
+        # many strong terms it contains. The separator cannot occur in a term.
+        lowered = [theory.lower() for theory in legal_theories]
+        starts = []
+        offset = 0
+        for theory in lowered:
+            starts.append(offset)
+            offset += len(theory) + 1
+        joined = "\x01".join(lowered)
+        return len({bisect_right(starts, end) - 1 for end, _ in _THEORY_AC.iter(joined)})
+
     def _assess_factual_strength(
         self,
         facts: List[str],
@@ -364,27 +546,15 @@ class StrategySimulator:
         
         combined_strength = (legal_strength * 0.6) + (factual_strength * 0.4)
         
-        # Determine outcome type
-        if scenario.client_position == "plaintiff":
-            if combined_strength > 0.7:
-                outcome = OutcomeType.JUDGMENT_ON_MERITS
-                probability = combined_strength
-            elif combined_strength > 0.5:
-                outcome = OutcomeType.SETTLEMENT
-                probability = 0.7
-            else:
-                outcome = OutcomeType.DISMISSAL
-                probability = 1.0 - combined_strength
-        else:  # defendant
-            if combined_strength > 0.7:
-                outcome = OutcomeType.DISMISSAL
-                probability = combined_strength
-            elif combined_strength > 0.5:
-                outcome = OutcomeType.SETTLEMENT
-                probability = 0.6
-            else:
-                outcome = OutcomeType.JUDGMENT_ON_MERITS
-                probability = 1.0 - combined_strength
+        # Determine outcome type: strong (> 0.7), moderate (> 0.5) or weak
+        defendant = int(scenario.client_position != "plaintiff")
+        band = 2 - (combined_strength > 0.7) - (combined_strength > 0.5)
+        outcome = _OUTCOME_TABLE[defendant, band]
+        probability = (
+            combined_strength,
+            float(_SETTLEMENT_PROB[defendant]),
+            1.0 - combined_strength
+        )[band]
         
         # Estimate settlement range (if applicable)
         settlement_range = (0.0, 0.0)
@@ -468,24 +638,13 @@ class StrategySimulator:
         return {
             'risk_level': risk_level.value,
             'risk_score': round(total_risk_score, 2),
-            'risk_factors': [asdict(rf) for rf in risk_factors],
+            'risk_factors': [rf.to_dict() for rf in risk_factors],
             'total_potential_loss': sum(rf.estimated_cost for rf in risk_factors)
         }
 
     def _classify_risk_level(self, score: float) -> RiskLevel:
         """Classify risk level from score"""
-        if score < 0.1:
-            return RiskLevel.VERY_LOW
-        elif score < 0.25:
-            return RiskLevel.LOW
-        elif score < 0.5:
-            return RiskLevel.MODERATE
-        elif score < 0.75:
-            return RiskLevel.HIGH
-        elif score < 0.9:
-            return RiskLevel.VERY_HIGH
-        else:
-            return RiskLevel.CRITICAL
+        return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, score)]
 
     def estimate_costs(
         self,
@@ -522,25 +681,10 @@ class StrategySimulator:
         limit: int = 3
     ) -> List[PrecedentStrength]:
         """Find precedents supporting position"""
-        precedents = []
-        
-        for theory in scenario.legal_theories[:2]:
-            try:
-                # This would query actual precedent database
-                precedent = PrecedentStrength(
-                    case_name=f"Supporting Case ({theory})",
-                    case_citation="[2023] GHASC 001",
-                    year=2023,
-                    authority_level="persuasive",
-                    similarity_score=0.8,
-                    supporting_holding=True,
-                    distinguishable=False
-                )
-                precedents.append(precedent)
-            except:
-                pass
-        
-        return precedents[:limit]
+        return [
+            self._lookup_precedent(theory, "support")
+            for theory in scenario.legal_theories[:2][:limit]
+        ]
 
     def _find_challenging_precedents(
         self,
@@ -548,25 +692,49 @@ class StrategySimulator:
         limit: int = 2
     ) -> List[PrecedentStrength]:
         """Find precedents challenging position"""
-        precedents = []
-        
-        for strength in scenario.opponent_strengths[:1]:
-            try:
-                precedent = PrecedentStrength(
-                    case_name=f"Challenging Case ({strength})",
-                    case_citation="[2022] GHASC 045",
-                    year=2022,
-                    authority_level="persuasive",
-                    similarity_score=0.6,
-                    supporting_holding=False,
-                    distinguishable=True,
-                    distinguishing_factors=["Different jurisdiction", "Different statute"]
-                )
-                precedents.append(precedent)
-            except:
-                pass
-        
-        return precedents[:limit]
+        return [
+            self._lookup_precedent(strength, "challenge")
+            for strength in scenario.opponent_strengths[:1][:limit]
+        ]
+
+    def _lookup_precedent_uncached(self, topic: str, kind: str) -> PrecedentStrength:
+        """
+        Look up the precedent for a legal theory ("support") or an opponent
+        strength ("challenge")
+        
+        Results are shared by every assessment that cites the same topic and
+        should be treated as read-only.
+        """
+        if kind == "support":
+            # This would query actual precedent database
+            return PrecedentStrength(
+                case_name=f"Supporting Case ({topic})",
+                case_citation="[2023] GHASC 001",
+                year=2023,
+                authority_level="persuasive",
+                similarity_score=0.8,
+                supporting_holding=True,
+                distinguishable=False
+            )
+        return PrecedentStrength(
+            case_name=f"Challenging Case ({topic})",
+            case_citation="[2022] GHASC 045",
+            year=2022,
+            authority_level="persuasive",
+            similarity_score=0.6,
+            supporting_holding=False,
+            distinguishable=True,
+            distinguishing_factors=["Different jurisdiction", "Different statute"]
+        )
+
+    def _prefetch_precedents(self, scenarios: List[LitigationScenario]) -> None:
+        """Look up each distinct precedent topic of a batch once, up front"""
+        topics = dict.fromkeys(
+            [(theory, "support") for s in scenarios for theory in s.legal_theories[:2]] +
+            [(strength, "challenge") for s in scenarios for strength in s.opponent_strengths[:1]]
+        )
+        for topic, kind in topics:
+            self._lookup_precedent(topic, kind)
 
     def _generate_recommendations(
         self,
@@ -599,7 +767,7 @@ class StrategySimulator:
         
         # Outcome assessment
         if outcome.outcome_probability > 0.6:
-            recommendations.append(f"Pursue aggressive litigation strategy toward {outcome.primary_outcome.value}")
+            recommendations.append(f"Pursue aggressive litigation strategy toward {outcome._outcome_value}")
         elif outcome.outcome_probability < 0.4:
             recommendations.append("Consider settlement or alternative dispute resolution")
         else:
@@ -610,17 +778,127 @@ class StrategySimulator:
         
         return strengths, weaknesses, recommendations
 
-    def compare_strategies(
+    def _batch_assess(
         self,
         scenarios: List[LitigationScenario],
-        budget: float = 50000.0
+        budget: float
     ) -> List[StrategyAssessment]:
-        """Compare multiple litigation strategies"""
+        """
+        Assess many scenarios, scoring them together as NumPy arrays
+        
+        Strengths, outcome selection, probabilities, timelines and damages
+        are computed for the whole batch in vector form, in the same order
+        of operations as the scalar methods, so each result matches
+        assess_strategy exactly. Only then are the per-scenario objects built.
+        """
+        n = len(scenarios)
+        if n == 0:
+            return []
+        
+        def counts(attr: str) -> np.ndarray:
+            return np.fromiter((len(getattr(s, attr)) for s in scenarios), dtype=np.int64, count=n)
+        
+        n_theories = counts('legal_theories')
+        n_facts = counts('key_facts')
+        n_opp_strengths = counts('opponent_strengths')
+        n_opp_weaknesses = counts('opponent_weaknesses')
+        strong_hits = np.fromiter(
+            (self._count_strong_theories(s.legal_theories) for s in scenarios),
+            dtype=np.int64, count=n
+        )
+        
+        # Legal strength (see _assess_legal_strength)
+        legal = 0.5 + np.minimum(0.2, n_theories * 0.05)
+        for k in range(int(strong_hits.max())):
+            legal[strong_hits > k] += 0.15
+        legal = np.where(n_theories == 0, 0.3, np.minimum(1.0, legal))
+        
+        # Factual strength (see _assess_factual_strength)
+        factual = 0.5 + np.minimum(0.2, n_facts * 0.02)
+        factual += np.minimum(0.2, n_opp_weaknesses * 0.05)
+        factual -= np.minimum(0.3, n_opp_strengths * 0.05)
+        factual = np.maximum(0.1, np.minimum(1.0, factual))
+        
+        # Outcome (see predict_outcome)
+        combined = (legal * 0.6) + (factual * 0.4)
+        plaintiff = np.fromiter((s.client_position == "plaintiff" for s in scenarios), dtype=bool, count=n)
+        defendant = (~plaintiff).astype(np.intp)
+        band = 2 - (combined > 0.7).astype(np.intp) - (combined > 0.5)
+        outcomes = _OUTCOME_TABLE[defendant, band].tolist()
+        probability = np.choose(band, (combined, _SETTLEMENT_PROB[defendant], 1.0 - combined))
+        probability = np.minimum(1.0, probability)
+        timeline = 365 + (100 * (1 - combined)).astype(np.int64)
+        damages = 50000 * combined
+        
+        # Overall score (see StrategyAssessment.calculate_overall_score), with
+        # procedural readiness 0.7 and prediction confidence 0.7
+        overall = (legal * 30 + factual * 25 + 0.7 * 15 + probability * 20 + 0.7 * 10) / 100 * 100
+        
         assessments = []
+        for i, scenario in enumerate(scenarios):
+            outcome = outcomes[i]
+            legal_i, factual_i, combined_i = float(legal[i]), float(factual[i]), float(combined[i])
+            has_damages = plaintiff[i] and outcome in [OutcomeType.SETTLEMENT, OutcomeType.JUDGMENT_ON_MERITS]
+            predicted_outcome = OutcomePrediction(
+                primary_outcome=outcome,
+                outcome_probability=float(probability[i]),
+                confidence=0.7,  # Moderate confidence in prediction
+                reasoning=self._generate_outcome_reasoning(scenario, combined_i, outcome),
+                timeline_estimate=int(timeline[i]),
+                likely_damages=float(damages[i]) if has_damages else None,
+                settlement_range=(25000, 75000) if has_damages else (0.0, 0.0)
+            )
+            assessments.append(self._build_assessment(
+                scenario, budget, legal_i, factual_i, predicted_outcome, float(overall[i])
+            ))
+        return assessments
+
+    def compare_strategies(
+        self,
+        scenarios: List[LitigationScenario],
+        budget: float = 50000.0,
+        executor: Optional[Executor] = None
+    ) -> List[StrategyAssessment]:
+        """
+        Compare multiple litigation strategies
+        
+        Args:
+            scenarios: Strategies to compare
+            budget: Available litigation budget
+            executor: Optional executor to assess uncached scenarios on, e.g.
+                a ThreadPoolExecutor once assessments wait on the LLM. Workers
+                of a ProcessPoolExecutor use their own simulator instance.
+                By default they are scored together in one vectorised batch.
+        """
+        # Reuse cached assessments; score only new, distinct scenarios
+        keys = [self._scenario_key(scenario, budget) for scenario in scenarios]
+        found: Dict[Tuple, StrategyAssessment] = {}
+        missing: Dict[Tuple, LitigationScenario] = {}
+        for key, scenario in zip(keys, scenarios):
+            if key in found or key in missing:
+                continue
+            cached = self._cached_assessment(key)
+            if cached is None:
+                missing[key] = scenario
+            else:
+                found[key] = cached
+        
+        todo = list(missing.values())
+        if executor is None:
+            self._prefetch_precedents(todo)
+            assessed = self._batch_assess(todo, budget)
+        elif isinstance(executor, ProcessPoolExecutor):
+            assessed = executor.map(_assess_in_worker, todo, repeat(budget))
+        else:
+            self._prefetch_precedents(todo)
+            assessed = executor.map(self._assess_uncached, todo, repeat(budget))
+        for key, assessment in zip(missing, assessed):
+            found[key] = assessment
+            self._remember_assessment(key, assessment)
         
-        for scenario in scenarios:
-            assessment = self.assess_strategy(scenario, budget)
-            assessments.append(assessment)
+        # The batch is stamped with a single assessment time
+        assessment_date = datetime.now().isoformat()
+        assessments = [replace(found[key], assessment_date=assessment_date) for key in keys]
         
         # Sort by overall score (highest first)
         return sorted(assessments, key=lambda a: a.overall_score, reverse=True)
@@ -638,6 +916,11 @@ def get_strategy_simulator() -> StrategySimulator:
     return _simulator
 
 
+def _assess_in_worker(scenario: LitigationScenario, budget: float) -> StrategyAssessment:
+    """Assess one scenario in a worker process (see compare_strategies)"""
+    return get_strategy_simulator()._assess_uncached(scenario, budget)
+
+
 if __name__ == "__main__":
     # Test strategy simulator
     simulator = get_strategy_simulator()
@@ -651,4 +934,4 @@ if __name__ == "__main__":
     
     print("Testing strategy simulator...")
     # assessment = simulator.assess_strategy(test_scenario)
-    # print(json.dumps(assessment.to_dict(), indent=2))
+    # print(assessment.to_json())
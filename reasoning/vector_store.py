@@ -3,31 +3,254 @@ Vector Store for Ghana Legal Knowledge
 Ingests statutes, cases, and customary law principles
 """
 
+import functools
+import hashlib
 import os
-from typing import List, Optional
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma  # Free alternative to Pinecone
+import random
+import re
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
-from pydantic import BaseModel
+from langchain_core.embeddings import Embeddings
 import json
 
-class LegalDocument(BaseModel):
-    """Ghana legal document structure"""
-    title: str
-    content: str
-    document_type: str  # "statute", "case_law", "customary", "guide"
-    jurisdiction: str
-    year: int
-    ethnic_group: Optional[str] = None  # For customary law
-    sections: List[str] = []
-    relevant_acts: List[str] = []
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Shortened from the model's native 1536: a third of the memory and distance
+# cost per vector for a small loss in retrieval quality. The collection name
+# carries the dimension, as Chroma cannot mix vector sizes.
+EMBEDDING_DIMENSIONS = 512
+COLLECTION_NAME = f"ghana-legal-knowledge-{EMBEDDING_DIMENSIONS}"
+
+# OpenAI embedding request limits: inputs per request, and a token budget
+# kept safely under the ~300k tokens allowed per request
+EMBED_BATCH_SIZE = 2048
+EMBED_BATCH_TOKENS = 280_000
+# Embedding requests in flight at once when a corpus needs several
+EMBED_CONCURRENCY = 5
+
+# Chunk size and overlap, in embedding tokens. Retrieval matches small
+# child chunks; search returns the larger parent chunk each came from.
+CHUNK_TOKENS = 512
+CHUNK_OVERLAP_TOKENS = 64
+CHILD_CHUNK_TOKENS = 200
+CHILD_OVERLAP_TOKENS = 20
+
+# Chunks shorter than this (stripped) carry no useful signal and are not stored
+MIN_CHUNK_CHARS = 50
+
+# Child chunks fetched per requested result, to fill k distinct parents
+PARENT_FETCH_FACTOR = 3
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    """tiktoken encoding used by text-embedding-3-small, or None if unavailable"""
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files are downloaded on first use and may be unreachable
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """
+    Embedding tokens in a text (≈ 4 characters per token without tiktoken)
+    
+    Memoized: splitting and batching measure the same paragraphs and
+    chunks more than once.
+    """
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode_ordinary(text))
+
+
+def _chunk_id(doc: Document) -> str:
+    """Stable ID for a chunk, so re-ingesting the same text is a no-op"""
+    return hashlib.sha1((doc.metadata.get("title", "") + doc.page_content).encode()).hexdigest()
+
+
+def _embedding_batches(texts: List[str]) -> Iterator[List[str]]:
+    """Split texts into request-sized batches for embed_documents"""
+    batch: List[str] = []
+    tokens = 0
+    for text in texts:
+        n = _count_tokens(text)
+        if batch and (len(batch) == EMBED_BATCH_SIZE or tokens + n > EMBED_BATCH_TOKENS):
+            yield batch
+            batch, tokens = [], 0
+        batch.append(text)
+        tokens += n
+    if batch:
+        yield batch
+
+
+# Blank-line paragraph breaks, and all-caps heading lines such as
+# "EWE CUSTOMARY LAW:" or "AKAN (Ashanti/Fante) LAND LAW:"
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_HEADING_RE = re.compile(r"^[A-Z][A-Z \-/]{3,}(\([^)]*\)[A-Z \-/]*)?:?$")
+
+
+class ParagraphGroupSplitter:
+    """
+    Split legal text into groups of whole consecutive paragraphs
+    
+    Paragraphs (blank-line separated blocks) are packed greedily into
+    chunks of at most max_tokens, and a heading line always starts a new
+    chunk. A paragraph is only cut when it alone exceeds the budget, in
+    which case it is handed to the fallback splitter.
+    """
+
+    def __init__(self, max_tokens: int, fallback: RecursiveCharacterTextSplitter):
+        self.max_tokens = max_tokens
+        self.fallback = fallback
+
+    def _paragraphs(self, text: str) -> List[str]:
+        """Dedented paragraphs of a text, breaking before heading lines"""
+        paragraphs = []
+        for block in _PARAGRAPH_BREAK_RE.split(text):
+            current: List[str] = []
+            for line in textwrap.dedent(block).strip().splitlines():
+                if current and _HEADING_RE.match(line.strip()):
+                    paragraphs.append("\n".join(current))
+                    current = []
+                current.append(line)
+            if current:
+                paragraphs.append("\n".join(current))
+        return paragraphs
+
+    def split_text(self, text: str) -> List[str]:
+        chunks: List[str] = []
+        group: List[str] = []
+        group_tokens = 0
+        for paragraph in self._paragraphs(text):
+            tokens = _count_tokens(paragraph)
+            if group and (group_tokens + tokens > self.max_tokens or _HEADING_RE.match(paragraph.split("\n", 1)[0])):
+                chunks.append("\n\n".join(group))
+                group, group_tokens = [], 0
+            if tokens > self.max_tokens:
+                chunks.extend(self.fallback.split_text(paragraph))
+                continue
+            group.append(paragraph)
+            group_tokens += tokens
+        if group:
+            chunks.append("\n\n".join(group))
+        return chunks
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        return [
+            Document(page_content=chunk, metadata=dict(doc.metadata))
+            for doc in documents
+            for chunk in self.split_text(doc.page_content)
+        ]
+
+
+class TokenWindowSplitter:
+    """
+    Split text into overlapping windows of embedding tokens
+    
+    Each text is encoded once and its windows sliced out by token offsets,
+    instead of re-measuring candidate pieces as the recursive splitter
+    does. Without tiktoken the fallback splitter is used.
+    """
+
+    def __init__(self, window_tokens: int, overlap_tokens: int, fallback: RecursiveCharacterTextSplitter):
+        self.window_tokens = window_tokens
+        self.overlap_tokens = overlap_tokens
+        self.fallback = fallback
+
+    def split_text(self, text: str) -> List[str]:
+        encoding = _encoding()
+        if encoding is None:
+            return self.fallback.split_text(text)
+        tokens = encoding.encode_ordinary(text)
+        if len(tokens) <= self.window_tokens:
+            return [text]
+        # Windows are cut from the text at the character where each boundary
+        # token starts. Decoding a token slice instead can split a multi-byte
+        # character (ɛ, ɔ, accented names) and store U+FFFD in its place.
+        decoded, offsets = encoding.decode_with_offsets(tokens)
+        offsets.append(len(decoded))
+        step = self.window_tokens - self.overlap_tokens
+        return [
+            decoded[offsets[start]:offsets[min(start + self.window_tokens, len(tokens))]]
+            for start in range(0, len(tokens) - self.overlap_tokens, step)
+        ]
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        return [
+            Document(page_content=chunk, metadata=dict(doc.metadata))
+            for doc in documents
+            for chunk in self.split_text(doc.page_content)
+        ]
+
+
+class _StoreEmbeddings(Embeddings):
+    """
+    Embedding function handed to Chroma
+    
+    Routes the wrapper's embedding calls through the store, so documents
+    added with add_texts are embedded in request-sized concurrent batches
+    and queries share the store's memoized query embeddings.
+    """
+
+    def __init__(self, store: "GhanaLegalVectorStore"):
+        self.store = store
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.store._embed_texts(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return list(self.store._embed_query(text))
+
 
 class GhanaLegalVectorStore:
     def __init__(self, persist_dir: str = "./chroma_db"):
         """Initialize Chroma vector store (free, local alternative to Pinecone)"""
         openai_key = os.getenv("OPENAI_API_KEY")
         
+        # Parent chunk text by ID, saved alongside the Chroma collection
+        self.parents_path = os.path.join(persist_dir, "parents.json")
+        self.parents = {}
+        if os.path.exists(self.parents_path):
+            with open(self.parents_path, 'r', encoding='utf-8') as f:
+                self.parents = json.load(f)
+        
+        # Repeated queries reuse their embedding instead of another API call
+        self._embed_query = functools.lru_cache(maxsize=4096)(self._embed_query_uncached)
+        
+        self.text_splitter = ParagraphGroupSplitter(
+            max_tokens=CHUNK_TOKENS,
+            fallback=RecursiveCharacterTextSplitter(
+                chunk_size=CHUNK_TOKENS,
+                chunk_overlap=CHUNK_OVERLAP_TOKENS,
+                length_function=_count_tokens,
+                separators=["\n\n", "\n", " ", ""]
+            )
+        )
+        self.child_splitter = TokenWindowSplitter(
+            window_tokens=CHILD_CHUNK_TOKENS,
+            overlap_tokens=CHILD_OVERLAP_TOKENS,
+            fallback=RecursiveCharacterTextSplitter(
+                chunk_size=CHILD_CHUNK_TOKENS,
+                chunk_overlap=CHILD_OVERLAP_TOKENS,
+                length_function=_count_tokens,
+                separators=["\n\n", "\n", " ", ""]
+            )
+        )
+        
         if not openai_key:
             print("⚠️ WARNING: OPENAI_API_KEY not set. Vector store features will be limited.")
             self.embeddings = None
@@ -35,26 +258,27 @@ class GhanaLegalVectorStore:
             return
         
         try:
+            # Imported here: Chroma and the OpenAI client are heavy, and are
+            # not needed at all when no API key is configured
+            from langchain_openai import OpenAIEmbeddings
+            from langchain_community.vectorstores import Chroma  # Free alternative to Pinecone
+            
             self.embeddings = OpenAIEmbeddings(
-                model="text-embedding-3-small",
-                api_key=openai_key
+                model=EMBEDDING_MODEL,
+                dimensions=EMBEDDING_DIMENSIONS,
+                api_key=openai_key,
+                chunk_size=EMBED_BATCH_SIZE
             )
             
             self.vectorstore = Chroma(
-                embedding_function=self.embeddings,
+                embedding_function=_StoreEmbeddings(self),
                 persist_directory=persist_dir,
-                collection_name="ghana-legal-knowledge"
+                collection_name=COLLECTION_NAME
             )
         except Exception as e:
             print(f"⚠️ Vector store initialization failed: {e}")
             self.embeddings = None
             self.vectorstore = None
-        
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            separators=["\n\n", "\n", " ", ""]
-        )
     
     def ingest_ghana_statutes(self):
         """
@@ -65,6 +289,35 @@ class GhanaLegalVectorStore:
             print("⚠️ Vector store not initialized. Skipping statute ingestion.")
             return
         
+        split_docs = self._split_documents(self._statute_documents())
+        added = self._add_documents(split_docs)
+        print(f"Ingested {len(split_docs)} statute chunks into vector store ({added} new)")
+    
+    def ingest_customary_law(self):
+        """Ingest Ghana's Customary Law Principles"""
+        if not self.vectorstore:
+            print("⚠️ Vector store not initialized. Skipping customary law ingestion.")
+            return
+        
+        split_docs = self._split_documents(self._customary_documents())
+        added = self._add_documents(split_docs)
+        print(f"Ingested {len(split_docs)} customary law chunks into vector store ({added} new)")
+    
+    def ingest_all(self):
+        """Ingest statutes and customary law together, in a single write"""
+        if not self.vectorstore:
+            print("⚠️ Vector store not initialized. Skipping ingestion.")
+            return
+        
+        statute_docs = self._split_documents(self._statute_documents())
+        customary_docs = self._split_documents(self._customary_documents())
+        added = self._add_documents(statute_docs + customary_docs)
+        print(f"Ingested {len(statute_docs)} statute chunks into vector store")
+        print(f"Ingested {len(customary_docs)} customary law chunks into vector store")
+        print(f"Embedded {added} new chunks")
+    
+    def _statute_documents(self) -> List[Document]:
+        """Ghana's key statutes as unsplit documents"""
         statutes = [
             # Constitutional Framework
             {
@@ -216,19 +469,10 @@ class GhanaLegalVectorStore:
             )
             documents.append(doc)
         
-        # Split into chunks
-        split_docs = self.text_splitter.split_documents(documents)
-        
-        # Add to vector store
-        self.vectorstore.add_documents(split_docs)
-        print(f"Ingested {len(split_docs)} statute chunks into vector store")
+        return documents
     
-    def ingest_customary_law(self):
-        """Ingest Ghana's Customary Law Principles"""
-        if not self.vectorstore:
-            print("⚠️ Vector store not initialized. Skipping customary law ingestion.")
-            return
-        
+    def _customary_documents(self) -> List[Document]:
+        """Ghana's customary law principles as unsplit documents"""
         customary_principles = [
             # Akan/Ashanti Customary Law
             {
@@ -356,29 +600,129 @@ class GhanaLegalVectorStore:
             )
             documents.append(doc)
         
-        split_docs = self.text_splitter.split_documents(documents)
-        self.vectorstore.add_documents(split_docs)
-        print(f"Ingested {len(split_docs)} customary law chunks into vector store")
+        return documents
+    
+    def _split_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into parent chunks, and those into child chunks
+        
+        Parents are recorded in self.parents; the returned children carry
+        their parent's ID in metadata["parent_id"].
+        """
+        children = []
+        for parent in self.text_splitter.split_documents(documents):
+            parent_id = _chunk_id(parent)
+            self.parents[parent_id] = parent.page_content
+            for child in self.child_splitter.split_documents([parent]):
+                child.metadata["parent_id"] = parent_id
+                children.append(child)
+        return children
+    
+    def _add_documents(self, documents: List[Document]) -> int:
+        """
+        Embed chunks in as few API requests as possible and add them to Chroma
+        
+        Near-empty chunks (under MIN_CHUNK_CHARS) and repeats of text already
+        seen in the batch, such as boilerplate shared by several statutes, are
+        dropped first.
+        
+        Chunks are keyed by a hash of their title and text. Chunks already in
+        the persisted collection are skipped before embedding, so warm starts
+        cost one lookup instead of re-embedding the corpus. The rest are
+        added with add_texts, whose embedding function (_StoreEmbeddings)
+        embeds them in batches of up to EMBED_BATCH_SIZE inputs and
+        EMBED_BATCH_TOKENS tokens.
+        
+        Returns:
+            Number of chunks added
+        """
+        chunks = {}
+        seen = set()
+        for doc in documents:
+            text = doc.page_content
+            if len(text.strip()) < MIN_CHUNK_CHARS:
+                continue
+            digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            if digest in seen:
+                continue
+            seen.add(digest)
+            chunks[_chunk_id(doc)] = doc
+        if not chunks:
+            return 0
+        
+        existing = set(self.vectorstore.get(ids=list(chunks), include=[])["ids"])
+        ids = [chunk_id for chunk_id in chunks if chunk_id not in existing]
+        if not ids:
+            return 0
+        
+        texts = [chunks[chunk_id].page_content for chunk_id in ids]
+        metadatas = [chunks[chunk_id].metadata for chunk_id in ids]
+        
+        self.vectorstore.add_texts(texts, metadatas=metadatas, ids=ids)
+        return len(ids)
     
     def semantic_search(self, query: str, k: int = 5):
-        """Search vector store semantically"""
+        """
+        Search vector store semantically
+        
+        Matching is done on child chunks; each result carries the full text
+        of the matched chunk's parent, scored by its best-matching child.
+        """
         if not self.vectorstore:
             print("⚠️ Vector store not available. Returning empty results.")
             return []
         
-        results = self.vectorstore.similarity_search_with_score(query, k=k)
+        results = self.vectorstore.similarity_search_by_vector_with_relevance_scores(
+            list(self._embed_query(query)), k=k * PARENT_FETCH_FACTOR
+        )
         
-        return [
-            {
-                "content": doc.page_content,
+        hits = []
+        seen = set()
+        for doc, score in results:
+            parent_id = doc.metadata.get("parent_id")
+            content = self.parents.get(parent_id, doc.page_content)
+            if content in seen:
+                continue
+            seen.add(content)
+            hits.append({
+                "content": content,
                 "relevance_score": score,
                 "metadata": doc.metadata,
-            }
-            for doc, score in results
-        ]
+            })
+            if len(hits) == k:
+                break
+        return hits
+    
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in request-sized batches, several requests at a time
+        
+        Batches go to the synchronous client from a pool of EMBED_CONCURRENCY
+        threads. This behaves the same whether or not an event loop is
+        running (e.g. during app startup). It also avoids tying the
+        client's pooled connections to a short-lived loop.
+        """
+        batches = list(_embedding_batches(texts))
+        if len(batches) <= 1:
+            return [vector for batch in batches for vector in self.embeddings.embed_documents(batch)]
+        with ThreadPoolExecutor(max_workers=EMBED_CONCURRENCY) as executor:
+            return [vector for batch in executor.map(self._embed_batch, batches) for vector in batch]
+    
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one of several concurrent batches"""
+        # Jitter keeps queued requests from firing in a burst and hitting 429s
+        time.sleep(random.uniform(0, 0.1))
+        return self.embeddings.embed_documents(batch)
+    
+    def _embed_query_uncached(self, query: str) -> tuple:
+        """Embedding of a search query; memoized per query in __init__"""
+        return tuple(self.embeddings.embed_query(query))
     
     def persist(self):
         """Save vector store to disk"""
+        os.makedirs(os.path.dirname(self.parents_path), exist_ok=True)
+        with open(self.parents_path, 'w', encoding='utf-8') as f:
+            json.dump(self.parents, f)
         self.vectorstore.persist()
 
 
@@ -390,11 +734,8 @@ def initialize_vector_store():
     global vector_store
     vector_store = GhanaLegalVectorStore()
     
-    # Ingest statutes
-    vector_store.ingest_ghana_statutes()
-    
-    # Ingest customary law
-    vector_store.ingest_customary_law()
+    # Ingest statutes and customary law in one batch
+    vector_store.ingest_all()
     
     # Persist to disk
     vector_store.persist()
@@ -7,6 +7,7 @@ This script starts the API and guides you through the testing process.
 
 import os
 import sys
+import socket
 import subprocess
 import time
 import webbrowser
@@ -78,34 +79,60 @@ def check_env_file():
         
         return True
 
+def wait_for_server(process, host='localhost', port=8000, timeout=10.0):
+    """Poll the API until /health answers, the process exits, or timeout passes"""
+    import requests
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            # Cheap TCP probe first; only try HTTP once the port is open
+            with socket.create_connection((host, port), timeout=0.05):
+                pass
+            if requests.get(f"http://{host}:{port}/health", timeout=0.5).status_code == 200:
+                return True
+        except (OSError, requests.RequestException):
+            pass
+        time.sleep(0.05)
+    return False
+
+SERVER_LOG = Path("glis_api.log")
+
 def start_api_server():
     """Start the FastAPI server"""
     print_header("STARTING API SERVER")
     
     print("Starting API on http://localhost:8000...")
     print("This will run in the background.")
+    print(f"Server output is written to {SERVER_LOG}")
     
     try:
-        # Use subprocess to start the server
-        process = subprocess.Popen(
-            [sys.executable, '-m', 'uvicorn', 'api.main:app', '--host', '0.0.0.0', '--port', '8000'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        # Use subprocess to start the server. Its output goes to a log file:
+        # unread pipes would block the server once their buffer filled up.
+        with open(SERVER_LOG, 'wb') as log:
+            process = subprocess.Popen(
+                [sys.executable, '-m', 'uvicorn', 'api.main:app', '--host', '0.0.0.0', '--port', '8000'],
+                stdout=log,
+                stderr=subprocess.STDOUT
+            )
         
         # Wait for server to start
-        print("Waiting for server to start (5 seconds)...")
-        time.sleep(5)
+        print("Waiting for server to start...")
+        ready = wait_for_server(process)
         
         # Check if process is still running
         if process.poll() is None:
-            print("✓ API Server Started Successfully!")
+            if ready:
+                print("✓ API Server Started Successfully!")
+            else:
+                print("⚠ API Server is running but not answering yet; it may still be loading")
             print(f"✓ Process ID: {process.pid}")
             return process
         else:
-            stdout, stderr = process.communicate()
             print(f"✗ Server failed to start")
-            print(f"Error: {stderr.decode()}")
+            print(f"Error: {SERVER_LOG.read_text(errors='replace')}")
             return None
     
     except Exception as e:
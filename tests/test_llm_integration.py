@@ -0,0 +1,480 @@
+"""
+Tests for the LLM orchestrator's fallback, retry, caching and concurrency
+
+Providers are scripted stand-ins, so no API key or network is needed.
+"""
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from reasoning import llm_integration
+from reasoning.llm_integration import (
+    LLMCache,
+    LLMConfig,
+    LLMOrchestrator,
+    LLMProvider,
+    LLMResponse,
+    ModelProvider,
+    OpenAIProvider,
+    TaskType,
+)
+
+
+class ScriptedProvider(LLMProvider):
+    """Plays back outcomes in order (the last one repeats) and records each call"""
+
+    def __init__(self, *outcomes, delay=0.0):
+        self.outcomes = list(outcomes) or ["ok"]
+        self.delay = delay
+        self.calls = []
+
+    def _next(self, prompt, config):
+        self.calls.append(config.primary_provider)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return LLMResponse(text=outcome, provider=config.primary_provider, tokens_used=3, cost_usd=0.01)
+
+    def generate(self, prompt, config):
+        return self._next(prompt, config)
+
+    async def agenerate(self, prompt, config):
+        await asyncio.sleep(self.delay)
+        return self._next(prompt, config)
+
+    def count_tokens(self, text):
+        return len(text) // 4
+
+    def estimate_cost(self, model, prompt_tokens, completion_tokens):
+        return 0.0
+
+
+def make_orchestrator(monkeypatch, tmp_path=None, providers=None, **config):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    orchestrator = LLMOrchestrator(LLMConfig(use_caching=False, **config))
+    orchestrator.cache = LLMCache(str(tmp_path)) if tmp_path is not None else None
+    orchestrator.providers = [None] * len(ModelProvider)
+    for model, provider in (providers or {}).items():
+        orchestrator.providers[model.ordinal] = provider
+    return orchestrator
+
+
+class TestProviderOrdinals:
+    """Ordinals index the provider array densely, in declaration order"""
+
+    def test_ordinals_follow_declaration_order(self):
+        assert [model.ordinal for model in ModelProvider] == list(range(len(ModelProvider)))
+
+    def test_available_providers_reads_the_array(self, monkeypatch):
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.MIXTRAL: ScriptedProvider()})
+
+        assert orchestrator.available_providers() == [ModelProvider.MIXTRAL]
+        with pytest.raises(ValueError):
+            orchestrator.set_primary_provider(ModelProvider.CLAUDE_3)
+
+
+HF_MODELS = [ModelProvider.LLAMA2_70B, ModelProvider.LLAMA2_13B, ModelProvider.MIXTRAL]
+
+
+class TestHuggingFaceRegistration:
+    """Open-source models register only when the model is available locally"""
+
+    def registered(self, monkeypatch, cached_path):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(llm_integration.importlib.util, "find_spec", lambda name: object())
+        monkeypatch.setitem(sys.modules, "huggingface_hub", SimpleNamespace(
+            try_to_load_from_cache=lambda repo_id, filename: cached_path
+        ))
+        orchestrator = LLMOrchestrator(LLMConfig(use_caching=False))
+        return orchestrator, [model for model in HF_MODELS if orchestrator.providers[model.ordinal] is not None]
+
+    def test_model_missing_from_cache_is_not_registered(self, monkeypatch):
+        _, registered = self.registered(monkeypatch, cached_path=None)
+
+        assert registered == []
+
+    def test_cached_model_registers_without_loading_the_tokenizer(self, monkeypatch):
+        orchestrator, registered = self.registered(monkeypatch, cached_path="/hf/tokenizer_config.json")
+
+        assert registered == HF_MODELS
+        assert "tokenizer" not in vars(orchestrator.providers[ModelProvider.MIXTRAL.ordinal])
+
+    def test_not_registered_without_transformers(self, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setattr(llm_integration.importlib.util, "find_spec", lambda name: None)
+
+        orchestrator = LLMOrchestrator(LLMConfig(use_caching=False))
+
+        assert orchestrator.available_providers() == []
+
+
+class TestFallbackAndRetry:
+    """Transient errors retry the same model; other errors move down the chain"""
+
+    def setup_method(self):
+        self.delays = []
+
+    def no_sleep(self, monkeypatch):
+        monkeypatch.setattr(llm_integration.random, "uniform", lambda low, high: 1.0)
+        monkeypatch.setattr(llm_integration.time, "sleep", self.delays.append)
+
+    def test_falls_back_in_chain_order(self, monkeypatch):
+        provider = ScriptedProvider(ValueError("bad request"), "from fallback")
+        orchestrator = make_orchestrator(monkeypatch, providers={
+            ModelProvider.OPENAI_GPT4: provider,
+            ModelProvider.OPENAI_GPT35: provider,
+            ModelProvider.CLAUDE_3: provider,
+        })
+
+        response = orchestrator.generate("Is a verbal lease valid?")
+
+        assert response.text == "from fallback"
+        assert response.provider == ModelProvider.OPENAI_GPT35
+        assert provider.calls == [ModelProvider.OPENAI_GPT4, ModelProvider.OPENAI_GPT35]
+
+    def test_unavailable_providers_are_skipped(self, monkeypatch):
+        provider = ScriptedProvider("from claude")
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.CLAUDE_3: provider})
+
+        assert orchestrator.generate("prompt").provider == ModelProvider.CLAUDE_3
+        assert provider.calls == [ModelProvider.CLAUDE_3]
+
+    def test_all_failing_raises_last_error(self, monkeypatch):
+        orchestrator = make_orchestrator(monkeypatch, providers={
+            ModelProvider.OPENAI_GPT4: ScriptedProvider(ValueError("first")),
+            ModelProvider.CLAUDE_3: ScriptedProvider(ValueError("last")),
+        })
+
+        with pytest.raises(RuntimeError, match="last"):
+            orchestrator.generate("prompt")
+
+    def test_transient_errors_retry_with_backoff(self, monkeypatch):
+        self.no_sleep(monkeypatch)
+        primary = ScriptedProvider(TimeoutError(), TimeoutError(), "third time")
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: primary})
+
+        response = orchestrator.generate("prompt")
+
+        assert response.text == "third time"
+        assert len(primary.calls) == 3
+        assert self.delays == [2.0, 4.0]
+
+    def test_retries_stop_at_retry_attempts(self, monkeypatch):
+        self.no_sleep(monkeypatch)
+        primary = ScriptedProvider(TimeoutError())
+        fallback = ScriptedProvider("from fallback")
+        orchestrator = make_orchestrator(monkeypatch, retry_attempts=2, providers={
+            ModelProvider.OPENAI_GPT4: primary,
+            ModelProvider.OPENAI_GPT35: fallback,
+        })
+
+        assert orchestrator.generate("prompt").text == "from fallback"
+        assert len(primary.calls) == 2
+        assert self.delays == [2.0]
+
+    def test_no_retry_past_the_task_deadline(self, monkeypatch):
+        orchestrator = make_orchestrator(monkeypatch, task_timeout_seconds=1)
+        monkeypatch.setattr(llm_integration.random, "uniform", lambda low, high: 1.0)
+        deadline = llm_integration.time.monotonic() + 1
+
+        assert orchestrator._retry_delay(TimeoutError(), 0, deadline) is None
+        assert orchestrator._retry_delay(ValueError(), 0, deadline + 60) is None
+        assert orchestrator._retry_delay(TimeoutError(), 0, deadline + 60) == 2.0
+
+    def test_async_path_uses_the_same_chain(self, monkeypatch):
+        self.no_sleep(monkeypatch)
+        monkeypatch.setattr(llm_integration.asyncio, "sleep", self.async_sleep)
+        primary = ScriptedProvider(TimeoutError(), ValueError("bad request"))
+        fallback = ScriptedProvider("from fallback")
+        orchestrator = make_orchestrator(monkeypatch, providers={
+            ModelProvider.OPENAI_GPT4: primary,
+            ModelProvider.OPENAI_GPT35: fallback,
+        })
+
+        response = asyncio.run(orchestrator.agenerate("prompt"))
+
+        assert response.text == "from fallback"
+        assert len(primary.calls) == 2
+        assert self.delays == [2.0]
+
+    async def async_sleep(self, delay):
+        if delay:
+            self.delays.append(delay)
+
+
+class TestResponseCache:
+    """Responses are cached per (prompt, model) and served back marked cached"""
+
+    def test_hit_and_miss(self, tmp_path):
+        cache = LLMCache(str(tmp_path))
+        response = LLMResponse(text="Held: valid", provider=ModelProvider.OPENAI_GPT4,
+                               tokens_used=12, cost_usd=0.5, task_type=TaskType.LEGAL_RESEARCH)
+
+        assert cache.get("prompt", ModelProvider.OPENAI_GPT4) is None
+        cache.set("prompt", response)
+        hit = cache.get("prompt", ModelProvider.OPENAI_GPT4)
+
+        assert hit.cached
+        assert (hit.text, hit.provider, hit.task_type, hit.cost_usd) == \
+            ("Held: valid", ModelProvider.OPENAI_GPT4, TaskType.LEGAL_RESEARCH, 0.5)
+        assert cache.get("prompt", ModelProvider.OPENAI_GPT35) is None
+        assert cache.get("other prompt", ModelProvider.OPENAI_GPT4) is None
+
+    def test_key_matches_plain_md5(self, tmp_path):
+        cache = LLMCache(str(tmp_path))
+
+        for model in (ModelProvider.OPENAI_GPT4, ModelProvider.CLAUDE_3):
+            expected = llm_integration.hashlib.md5(f"prompt:{model.value}".encode()).hexdigest()
+            assert cache._get_key("prompt", model) == expected
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = LLMCache(str(tmp_path))
+        (tmp_path / f"{cache._get_key('prompt', ModelProvider.OPENAI_GPT4)}.json").write_bytes(b"{not json")
+
+        assert cache.get("prompt", ModelProvider.OPENAI_GPT4) is None
+
+    @pytest.mark.skipif(not llm_integration.HAS_ZSTD, reason="zstandard not installed")
+    def test_entries_are_compressed_once_a_dictionary_is_trained(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(llm_integration, "ZSTD_DICT_SAMPLES", 200)
+        monkeypatch.setattr(llm_integration, "ZSTD_DICT_SIZE", 4096)
+        cache = LLMCache(str(tmp_path))
+        for i in range(200):
+            cache.set(f"prompt {i}", LLMResponse(
+                text=f"The court held in case {i} that the stool land lease was {'valid' if i % 2 else 'void'}.",
+                provider=ModelProvider.OPENAI_GPT4, tokens_used=i, cost_usd=0.01 * i
+            ))
+
+        assert (tmp_path / "zstd.dict").exists()
+        cache.set("fresh", LLMResponse(text="Compressed", provider=ModelProvider.OPENAI_GPT4,
+                                       tokens_used=1, cost_usd=0.0))
+        key = cache._get_key("fresh", ModelProvider.OPENAI_GPT4)
+        assert (tmp_path / f"{key}.json.zst").exists()
+
+        reopened = LLMCache(str(tmp_path))
+        assert reopened.get("fresh", ModelProvider.OPENAI_GPT4).text == "Compressed"
+        assert reopened.get("prompt 3", ModelProvider.OPENAI_GPT4).tokens_used == 3
+
+    def test_orchestrator_serves_repeats_from_cache(self, tmp_path, monkeypatch):
+        provider = ScriptedProvider("Held: valid")
+        orchestrator = make_orchestrator(monkeypatch, tmp_path, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        first = orchestrator.generate("prompt")
+        second = orchestrator.generate("prompt")
+        other_system = orchestrator.generate("prompt", system="Answer in one word.")
+
+        assert not first.cached and second.cached
+        assert second.text == "Held: valid"
+        assert not other_system.cached
+        assert len(provider.calls) == 2
+
+
+class TestCoalescing:
+    """Identical concurrent async requests share one provider call"""
+
+    def test_identical_requests_share_a_call(self, monkeypatch):
+        provider = ScriptedProvider("shared", delay=0.05)
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        async def run():
+            return await asyncio.gather(*(orchestrator.agenerate("same prompt") for _ in range(5)))
+
+        responses = asyncio.run(run())
+
+        assert [r.text for r in responses] == ["shared"] * 5
+        assert len(provider.calls) == 1
+        assert orchestrator._inflight == {}
+
+    def test_cancelled_waiter_does_not_cancel_the_others(self, monkeypatch):
+        provider = ScriptedProvider("shared", delay=0.05)
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        async def run():
+            first = asyncio.ensure_future(orchestrator.agenerate("same prompt"))
+            second = asyncio.ensure_future(orchestrator.agenerate("same prompt"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()).text == "shared"
+        assert len(provider.calls) == 1
+
+    def test_different_prompts_are_not_coalesced(self, monkeypatch):
+        provider = ScriptedProvider("answer", delay=0.01)
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        responses = orchestrator.generate_batch(["first", "second", "first"])
+
+        assert len(responses) == 3
+        assert len(provider.calls) == 2
+
+    def test_generate_batch_inside_a_running_loop(self, monkeypatch):
+        provider = ScriptedProvider("answer")
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        async def handler():
+            return orchestrator.generate_batch(["first", "second"])
+
+        assert [r.text for r in asyncio.run(handler())] == ["answer", "answer"]
+
+
+class TestSpeculativeRacing:
+    """With speculative=True the primary races the first fallback"""
+
+    def race(self, monkeypatch, primary_delay, draft_delay):
+        primary = ScriptedProvider("primary", delay=primary_delay)
+        draft = ScriptedProvider("draft", delay=draft_delay)
+        orchestrator = make_orchestrator(monkeypatch, speculative=True, speculative_deadline_ms=50, providers={
+            ModelProvider.OPENAI_GPT4: primary,
+            ModelProvider.OPENAI_GPT35: draft,
+        })
+        return asyncio.run(orchestrator.agenerate("prompt")).text
+
+    def test_primary_wins_within_the_deadline(self, monkeypatch):
+        assert self.race(monkeypatch, primary_delay=0.01, draft_delay=0.0) == "primary"
+
+    def test_draft_wins_when_primary_is_slow(self, monkeypatch):
+        assert self.race(monkeypatch, primary_delay=1.0, draft_delay=0.0) == "draft"
+
+
+class FakeStreamClient:
+    """Chat completions client returning canned stream chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.kwargs = None
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        self.kwargs = kwargs
+        return iter(self.chunks)
+
+
+def delta(text):
+    return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class TestStreamingUsage:
+    """Streamed responses are billed from the usage chunk when the API sends one"""
+
+    def stream(self, chunks):
+        provider = OpenAIProvider(api_key="test-key")
+        provider.client = FakeStreamClient(chunks)
+        config = LLMConfig(primary_provider=ModelProvider.OPENAI_GPT35)
+        stream = provider.generate_stream("What is adverse possession?", config)
+        parts = []
+        while True:
+            try:
+                parts.append(next(stream))
+            except StopIteration as done:
+                return provider, parts, done.value
+
+    def test_usage_chunk_is_used(self):
+        usage = SimpleNamespace(prompt_tokens=40, completion_tokens=10)
+        provider, parts, response = self.stream([
+            delta("Twelve"), delta(" years."), SimpleNamespace(usage=usage, choices=[])
+        ])
+
+        assert parts == ["Twelve", " years."]
+        assert response.text == "Twelve years."
+        assert response.tokens_used == 50
+        assert response.cost_usd == pytest.approx(provider.estimate_cost(ModelProvider.OPENAI_GPT35, 40, 10))
+        assert response.first_token_ts <= response.last_token_ts
+        assert provider.client.kwargs["stream_options"] == {"include_usage": True}
+
+    def test_estimates_without_a_usage_chunk(self):
+        provider, parts, response = self.stream([delta("Twelve"), delta(" years.")])
+
+        expected = provider.count_tokens("What is adverse possession?") + provider.count_tokens("Twelve years.")
+        assert response.tokens_used == expected
+
+
+class TestTemplateFormatting:
+    """Template prompts are formatted once per distinct set of variables"""
+
+    def test_repeated_variables_hit_the_cache(self, monkeypatch):
+        provider = ScriptedProvider("brief")
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        orchestrator.generate_from_template("brief_facts", case_text="Mensah v Owusu")
+        orchestrator.generate_from_template("brief_facts", case_text="Mensah v Owusu")
+        orchestrator.generate_from_template("brief_facts", case_text="Boateng v Asante")
+
+        info = orchestrator._format_prompt.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_unhashable_variables_are_formatted_directly(self, monkeypatch):
+        provider = ScriptedProvider("brief")
+        orchestrator = make_orchestrator(monkeypatch, providers={ModelProvider.OPENAI_GPT4: provider})
+
+        response = orchestrator.generate_from_template("brief_facts", case_text=["Mensah v Owusu"])
+
+        assert response.text == "brief"
+        assert orchestrator._format_prompt.cache_info().currsize == 0
+
+
+class WordEncoding:
+    """One token per whitespace-separated word, shaped like a tiktoken Encoding"""
+
+    name = "words"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode_ordinary(self, text):
+        self.encoded.append(text)
+        return text.split()
+
+
+class TestTemplateTokenCounts:
+    """Template token counts include the system prompt actually sent"""
+
+    def setup_method(self):
+        self.encoding = WordEncoding()
+
+    def orchestrator(self, monkeypatch, **config):
+        orchestrator = make_orchestrator(monkeypatch, **config)
+        orchestrator.__dict__["_encoding"] = self.encoding
+        return orchestrator
+
+    def expected(self, orchestrator, system_prompt, **variables):
+        prompt = orchestrator.prompt_templates["statute_interpretation"].format(**variables)
+        return len(system_prompt.split()) + len(prompt.split())
+
+    def test_counts_the_configured_system_prompt(self, monkeypatch):
+        orchestrator = self.orchestrator(monkeypatch, system_prompt="You draft Ghanaian pleadings.")
+        variables = dict(statute_text="Land Act, 2020 (Act 1036)", section="s. 10", context="stool land lease")
+
+        count = orchestrator.count_template_tokens("statute_interpretation", **variables)
+
+        assert count == self.expected(orchestrator, "You draft Ghanaian pleadings.", **variables)
+
+    def test_counts_a_system_override(self, monkeypatch):
+        orchestrator = self.orchestrator(monkeypatch)
+        variables = dict(statute_text="Land Act, 2020 (Act 1036)", section="s. 10", context="stool land lease")
+
+        count = orchestrator.count_template_tokens("statute_interpretation", system="Answer briefly.", **variables)
+
+        assert count == self.expected(orchestrator, "Answer briefly.", **variables)
+
+    def test_literal_segments_are_tokenized_once(self, monkeypatch):
+        orchestrator = self.orchestrator(monkeypatch)
+        template = orchestrator.prompt_templates["statute_interpretation"]
+
+        for section in ("s. 10", "s. 11", "s. 12"):
+            orchestrator.count_template_tokens(
+                "statute_interpretation", statute_text="Land Act", section=section, context="lease"
+            )
+
+        assert sum(text in template._literals for text in self.encoding.encoded) == len(template._literals)
+        assert self.encoding.encoded.count(orchestrator.config.system_prompt) == 1
+
+    def test_estimate_without_an_encoding(self, monkeypatch):
+        orchestrator = make_orchestrator(monkeypatch)
+        orchestrator.__dict__["_encoding"] = None
+        template = orchestrator.prompt_templates["brief_facts"]
+
+        count = orchestrator.count_template_tokens("brief_facts", system="Be brief.", case_text="Mensah v Owusu")
+
+        assert count == (len("Be brief.") + len(template.format(case_text="Mensah v Owusu"))) // 4
@@ -0,0 +1,247 @@
+"""
+Tests for fact-expansion reuse and batch generation in the Pleadings Assistant
+
+Uses a stand-in LLM and embedding model, so no API key or model download
+is needed.
+"""
+import asyncio
+import logging
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from reasoning.pleadings_assistant import (
+    PleadingsAssistant,
+    PleadingType,
+    CourtType,
+    SEMANTIC_CACHE_MAX_CHARS,
+)
+
+
+class FakeLLM:
+    """Returns two numbered paragraphs per call and counts the calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_stream(self, prompt, task_type=None, system=None):
+        self.calls += 1
+        yield f"1. Expansion {self.calls} of {prompt}\n2. Second paragraph"
+
+    async def agenerate(self, prompt, task_type=None, system=None):
+        self.calls += 1
+        return SimpleNamespace(text=f"1. Expansion {self.calls} of {prompt}\n2. Second paragraph")
+
+
+class FakeBert:
+    """Embeds every text to the same vector, so any two texts look identical"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_text(self, text):
+        self.calls += 1
+        return np.ones(8, dtype=np.float32)
+
+
+CONTEXT = (PleadingType.STATEMENT_OF_CLAIM, CourtType.HIGH_COURT)
+
+
+def make_assistant(semantic: bool = False) -> PleadingsAssistant:
+    assistant = PleadingsAssistant(semantic_facts_cache=semantic)
+    assistant.llm = FakeLLM()
+    assistant._facts_cache._bert = FakeBert()
+    assistant._facts_cache._bert_loaded = True
+    return assistant
+
+
+def expand(assistant, facts):
+    return assistant._expand_facts_cached(*CONTEXT, facts)
+
+
+class TestExactReuse:
+    """Exact repeats reuse their expansion without an embedding"""
+
+    def test_exact_repeat_reuses_expansion(self):
+        assistant = make_assistant()
+        facts = ["Kwame Mensah sold land to Ama Owusu on 3 March 2021"]
+
+        first = expand(assistant, facts)
+        second = expand(assistant, facts)
+
+        assert first == second
+        assert assistant.llm.calls == 1
+        assert assistant._facts_cache._bert.calls == 0
+
+    def test_near_duplicate_not_reused_by_default(self):
+        assistant = make_assistant()
+
+        expand(assistant, ["Kwame Mensah sold land to Ama Owusu for GH¢10,000"])
+        expand(assistant, ["Kofi Boateng sold land to Ama Owusu for GH¢10,000"])
+
+        assert assistant.llm.calls == 2
+        assert assistant._facts_cache._bert.calls == 0
+
+    def test_exact_repeat_skips_embedding_when_semantic(self):
+        assistant = make_assistant(semantic=True)
+        facts = ["Kwame Mensah sold land to Ama Owusu on 3 March 2021"]
+
+        expand(assistant, facts)
+        expand(assistant, facts)
+
+        assert assistant.llm.calls == 1
+        assert assistant._facts_cache._bert.calls == 1
+
+    def test_evicted_fact_set_is_expanded_again(self):
+        assistant = make_assistant()
+        assistant._facts_cache.max_entries = 1
+        facts = ["Kwame Mensah sold land to Ama Owusu on 3 March 2021"]
+
+        expand(assistant, facts)
+        expand(assistant, ["Kofi Boateng leased a shop to Yaw Asante"])
+        expand(assistant, facts)
+
+        assert assistant.llm.calls == 3
+
+    def test_async_exact_repeat_reuses_expansion(self):
+        assistant = make_assistant()
+        facts = ["Kwame Mensah sold land to Ama Owusu on 3 March 2021"]
+
+        first = asyncio.run(assistant._aexpand_facts_cached(*CONTEXT, facts))
+        second = asyncio.run(assistant._aexpand_facts_cached(*CONTEXT, facts))
+
+        assert first == second
+        assert assistant.llm.calls == 1
+
+
+class TestSemanticReuse:
+    """Near-duplicate reuse is opt-in and requires the same names, numbers and dates"""
+
+    def test_rewording_with_same_details_is_reused(self):
+        assistant = make_assistant(semantic=True)
+
+        first = expand(assistant, ["Kwame Mensah sold land to Ama Owusu for GH¢10,000"])
+        second = expand(assistant, ["Kwame Mensah sold the land to Ama Owusu for GH¢10,000"])
+
+        assert first == second
+        assert assistant.llm.calls == 1
+
+    def test_different_party_is_not_reused(self):
+        assistant = make_assistant(semantic=True)
+
+        expand(assistant, ["Kwame Mensah sold land to Ama Owusu for GH¢10,000"])
+        expand(assistant, ["Kofi Boateng sold land to Ama Owusu for GH¢10,000"])
+
+        assert assistant.llm.calls == 2
+
+    def test_different_amount_or_date_is_not_reused(self):
+        assistant = make_assistant(semantic=True)
+
+        expand(assistant, ["Kwame Mensah paid GH¢10,000 on 3 March 2021"])
+        expand(assistant, ["Kwame Mensah paid GH¢12,000 on 3 March 2021"])
+        expand(assistant, ["Kwame Mensah paid GH¢10,000 on 4 March 2021"])
+
+        assert assistant.llm.calls == 3
+
+    def test_text_beyond_embedding_window_is_not_reused(self):
+        assistant = make_assistant(semantic=True)
+        prefix = "x" * SEMANTIC_CACHE_MAX_CHARS
+
+        expand(assistant, [prefix, "the sale was completed"])
+        expand(assistant, [prefix, "the sale was never completed"])
+
+        assert assistant.llm.calls == 2
+        assert assistant._facts_cache._bert.calls == 0
+
+    def test_async_embedding_runs_off_the_event_loop(self):
+        assistant = make_assistant(semantic=True)
+        threads = []
+        bert = assistant._facts_cache._bert
+        embed_text = bert.embed_text
+
+        def recording_embed(text):
+            threads.append(threading.get_ident())
+            return embed_text(text)
+
+        bert.embed_text = recording_embed
+
+        async def run():
+            await assistant._aexpand_facts_cached(*CONTEXT, ["Kwame Mensah paid GH¢10,000"])
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        assert threads and loop_thread not in threads
+
+
+class TestBatchGenerate:
+    """Batches run from sync and async callers alike; failures are logged and skipped"""
+
+    def setup_method(self):
+        self.assistant = make_assistant()
+        self.assistant.agenerate_pleading = self.fake_generate
+
+    async def fake_generate(self, pleading_type, metadata, facts, legal_basis, relief_sought, generated_date=None):
+        if metadata is None:
+            raise ValueError("metadata is required")
+        await asyncio.sleep(0)
+        return (pleading_type, metadata, generated_date)
+
+    REQUESTS = [
+        {"type": "statement_of_claim", "metadata": "Mensah v Owusu"},
+        {"type": "defence"},
+        {"type": "defence", "metadata": "Boateng v Asante"},
+    ]
+
+    def test_keeps_request_order_and_skips_failures(self, caplog):
+        with caplog.at_level(logging.ERROR, logger="reasoning.pleadings_assistant"):
+            pleadings = self.assistant.batch_generate(self.REQUESTS)
+
+        assert [(p[0], p[1]) for p in pleadings] == [
+            (PleadingType.STATEMENT_OF_CLAIM, "Mensah v Owusu"),
+            (PleadingType.DEFENCE, "Boateng v Asante"),
+        ]
+        assert pleadings[0][2] == pleadings[1][2] is not None
+        assert "metadata is required" in caplog.text
+
+    def test_works_inside_a_running_event_loop(self):
+        async def handler():
+            return self.assistant.batch_generate(self.REQUESTS)
+
+        assert len(asyncio.run(handler())) == 2
+
+
+def baseline_numbered_facts(facts_text):
+    """Numbered-line parsing as originally written"""
+    return [f.strip() for f in facts_text.split('\n') if f.strip() and any(c.isdigit() for c in f[:3])]
+
+
+class TestNumberedFacts:
+    """Streamed parsing keeps the lines the original parser kept"""
+
+    RESPONSE = "\n".join([
+        "Here are the paragraphs:",
+        "1. The Plaintiff is a trader resident at Kumasi.",
+        "(2) The Defendant is a farmer at Ejisu.",
+        "**3.** On 3 March 2021 the Defendant took possession.",
+        " 4) The Plaintiff paid GH¢10,000.",
+        "   5. Indented past the third character.",
+        "",
+        "In 2021 the parties met.",
+        "12. The Plaintiff claims damages.",
+    ])
+
+    def test_matches_baseline_parser(self):
+        parsed = PleadingsAssistant._parse_numbered_facts(self.RESPONSE)
+
+        assert list(parsed) == baseline_numbered_facts(self.RESPONSE)
+        assert "(2) The Defendant is a farmer at Ejisu." in parsed
+        assert "**3.** On 3 March 2021 the Defendant took possession." in parsed
+
+    def test_stream_split_anywhere_matches_baseline(self):
+        expected = baseline_numbered_facts(self.RESPONSE)
+
+        for size in (1, 2, 5, 17, len(self.RESPONSE)):
+            chunks = [self.RESPONSE[i:i + size] for i in range(0, len(self.RESPONSE), size)]
+            assert list(PleadingsAssistant._iter_numbered_facts(chunks)) == expected, size
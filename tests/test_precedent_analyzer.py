@@ -0,0 +1,144 @@
+"""
+Tests for the Precedent Analyzer's text extraction and caching
+"""
+import json
+import random
+
+from intelligence.citation_network import CitationNetworkGraph
+from reasoning.precedent_analyzer import PrecedentAnalyzer, TEXT_CACHE_SIZE, _extract_holding
+
+
+def baseline_extract_holding(text: str) -> str:
+    """Holding extraction as originally written, one marker at a time"""
+    conclusion_markers = ["In the result", "In conclusion", "We hold", "We find"]
+    for marker in conclusion_markers:
+        if marker.lower() in text.lower():
+            idx = text.lower().find(marker.lower())
+            return text[idx:idx+300].strip()
+    return text[:200].strip()
+
+
+class TestHoldingExtraction:
+    """_extract_holding must match the original marker-priority extraction"""
+
+    def test_prefers_in_the_result_over_earlier_markers(self):
+        text = "We find the witness credible. " * 5 + "In the result the appeal is allowed."
+
+        assert _extract_holding(text).startswith("In the result")
+        assert _extract_holding(text) == baseline_extract_holding(text)
+
+    def test_falls_back_to_later_markers_in_priority_order(self):
+        text = "Background. We find the facts proved. We hold that the contract was void."
+
+        assert _extract_holding(text).startswith("We hold")
+
+    def test_markers_match_inside_words_as_before(self):
+        text = "The panel agreed: swe hold nothing back."
+
+        assert _extract_holding(text) == baseline_extract_holding(text)
+
+    def test_no_marker_returns_opening_text(self):
+        text = "The plaintiff sued for damages. " * 20
+
+        assert _extract_holding(text) == text[:200].strip()
+
+    def test_matches_baseline_on_synthetic_judgments(self):
+        rng = random.Random(0)
+        pieces = [
+            "The appellant contends the lease was not valid.",
+            "We find that the defendant was not in breach.",
+            "WE HOLD that the stool land was properly alienated.",
+            "In conclusion, the trial judge erred.",
+            "In the result, the appeal succeeds in part.",
+            "The respondent relied on customary evidence.",
+            "Counsel cited Republic v High Court, Accra.",
+        ]
+        for _ in range(500):
+            text = " ".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+            assert _extract_holding(text) == baseline_extract_holding(text), text
+
+
+def make_database():
+    return [
+        {"case_id": "C1", "case_name": "Mensah v Owusu", "date_decided": "2010-05-01",
+         "full_text": "The respondent's repudiation of the lease was accepted."},
+        {"case_id": "C2", "case_name": "Boateng v Asante", "date_decided": "2015-02-03",
+         "full_text": "No question of repudiation arises; we find for the plaintiff."},
+    ]
+
+
+class TestCaseCaches:
+    """Cached case text and indexes follow edits to the database"""
+
+    def test_edited_case_text_is_reread(self):
+        analyzer = PrecedentAnalyzer()
+        case = make_database()[0]
+
+        assert "repudiation" in analyzer._lower(case)
+        case["full_text"] = "The lease was performed in full."
+
+        assert analyzer._lower(case) == "the lease was performed in full."
+        assert not analyzer._mentions(case, "repudiation")
+
+    def test_in_place_edit_invalidates_index(self):
+        analyzer = PrecedentAnalyzer()
+        database = make_database()
+        analyzer.build_index(database)
+
+        assert [c.case_id for c in analyzer.find_precedent_cases("repudiation", database)] == ["C1", "C2"]
+
+        # Same list, same length: only the contents change
+        database[0]["full_text"] = database[0]["full_text"].replace("repudiation", "performance")
+        database[1]["date_decided"] = "1990-02-03"
+
+        assert analyzer.find_precedent_cases("repudiation", database) == []
+
+    def test_text_caches_are_bounded(self):
+        analyzer = PrecedentAnalyzer()
+
+        for i in range(TEXT_CACHE_SIZE + 10):
+            analyzer._lower({"case_id": "C1", "full_text": f"Case text {i}"})
+
+        assert analyzer._lower_text.cache_info().currsize == TEXT_CACHE_SIZE
+
+
+def analyzer_with_empty_network() -> PrecedentAnalyzer:
+    """Analyzer on its own citation network rather than the shared singleton"""
+    analyzer = PrecedentAnalyzer()
+    analyzer.citation_network = CitationNetworkGraph()
+    analyzer._status_version = analyzer.citation_network.version
+    return analyzer
+
+
+class TestCaseStatus:
+    """Resolved statuses follow changes to the citation network"""
+
+    def test_status_updates_after_new_citations(self):
+        analyzer = analyzer_with_empty_network()
+        case_id = "[2010] GHASC 5"
+
+        assert analyzer._determine_case_status(case_id) == "unknown"
+
+        analyzer.citation_network.add_case_citations(
+            "[2020] GHASC 9", "This court overruled [2010] GHASC 5 in full.", "2020-01-01"
+        )
+
+        assert analyzer._determine_case_status(case_id) == "overruled"
+
+    def test_status_updates_after_import(self, tmp_path):
+        path = tmp_path / "network.json"
+        path.write_text(json.dumps({"relationships": [{
+            "citing_case_id": "[2020] GHASC 9",
+            "cited_case_id": "[2010] GHASC 5",
+            "relationship_type": "overruled",
+            "context": "This court overruled [2010] GHASC 5 in full.",
+            "date_cited": "2020-01-01",
+            "is_primary": True,
+        }]}))
+
+        analyzer = analyzer_with_empty_network()
+        assert analyzer._determine_case_status("[2010] GHASC 5") == "unknown"
+
+        analyzer.citation_network.import_network_graph(str(path))
+
+        assert analyzer._determine_case_status("[2010] GHASC 5") == "overruled"
@@ -0,0 +1,107 @@
+"""
+Tests for the Strategy Simulator's vectorised batch scoring and cost estimates
+"""
+import dataclasses
+import random
+
+import pytest
+
+from reasoning.strategy_simulator import CostEstimate, StrategySimulator, LitigationScenario
+
+
+THEORIES = [
+    "Breach of contract", "FIDUCIARY DUTY owed", "fraud", "Negligence",
+    "conversion of goods", "Trespass", "statutory violation",
+    "Failure of consideration", "estoppel", "unjust enrichment",
+    "Wrongful dismissal", "defamation",
+]
+
+
+def random_scenarios(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        LitigationScenario(
+            name=f"Scenario {i}",
+            client_position=rng.choice(["plaintiff", "defendant"]),
+            key_facts=[f"fact {k}" for k in range(rng.randint(0, 12))],
+            legal_theories=rng.sample(THEORIES, rng.randint(0, 6)),
+            opponent_strengths=[f"strength {k}" for k in range(rng.randint(0, 7))],
+            opponent_weaknesses=[f"weakness {k}" for k in range(rng.randint(0, 5))],
+        )
+        for i in range(count)
+    ]
+
+
+def outcome_fields(assessment):
+    outcome = assessment.predicted_outcome
+    return (
+        outcome.primary_outcome,
+        outcome.outcome_probability,
+        outcome.confidence,
+        outcome.reasoning,
+        outcome.timeline_estimate,
+        outcome.likely_damages,
+        tuple(outcome.settlement_range),
+    )
+
+
+class TestBatchAssess:
+    """_batch_assess must give exactly what the scalar pipeline gives"""
+
+    def setup_method(self):
+        self.simulator = StrategySimulator()
+
+    def test_matches_scalar_assessment(self):
+        scenarios = random_scenarios(300)
+
+        batch = self.simulator._batch_assess(scenarios, 50000.0)
+        scalar = [self.simulator._assess_uncached(scenario, 50000.0) for scenario in scenarios]
+
+        assert len(batch) == len(scalar)
+        for b, s in zip(batch, scalar):
+            assert b.legal_strength == s.legal_strength
+            assert b.factual_strength == s.factual_strength
+            assert outcome_fields(b) == outcome_fields(s)
+            assert b.overall_score == s.overall_score
+            assert b.risk_assessment == s.risk_assessment
+            assert b.cost_estimate.total_cost == s.cost_estimate.total_cost
+            assert (b.strengths, b.weaknesses, b.recommendations) == (s.strengths, s.weaknesses, s.recommendations)
+
+    def test_empty_batch(self):
+        assert self.simulator._batch_assess([], 50000.0) == []
+
+    def test_compare_strategies_orders_by_scalar_score(self):
+        scenarios = random_scenarios(20, seed=1)
+
+        compared = self.simulator.compare_strategies(scenarios, budget=30000.0)
+        expected = sorted(
+            (self.simulator._assess_uncached(scenario, 30000.0).overall_score for scenario in scenarios),
+            reverse=True
+        )
+
+        assert [a.overall_score for a in compared] == expected
+
+
+class TestCostEstimate:
+    """Precomputed totals cannot go stale: estimates are immutable"""
+
+    def test_totals_match_the_fields(self):
+        estimate = CostEstimate(15000.0, 500.0, 2000.0, 3000.0, 1500.0, 4000.0, 0.0, miscellaneous=250.0)
+
+        assert estimate.total_cost == 26250.0
+        assert estimate.attorney_hours_estimate == 30.0
+        assert estimate.to_dict()["total_cost"] == estimate.total_cost
+
+    def test_fields_cannot_be_reassigned(self):
+        estimate = CostEstimate(15000.0, 500.0, 2000.0, 3000.0, 1500.0, 4000.0, 0.0)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            estimate.attorney_fees = 30000.0
+
+    def test_replace_recomputes_totals(self):
+        estimate = CostEstimate(15000.0, 500.0, 2000.0, 3000.0, 1500.0, 4000.0, 0.0)
+
+        revised = dataclasses.replace(estimate, attorney_fees=30000.0, hourly_rate=600.0)
+
+        assert revised.total_cost == estimate.total_cost + 15000.0
+        assert revised.attorney_hours_estimate == 50.0
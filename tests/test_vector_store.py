@@ -0,0 +1,291 @@
+"""
+Tests for the Ghana legal vector store
+
+Chroma and OpenAI embeddings are replaced by in-memory stand-ins, so no
+API key or database is needed.
+"""
+import asyncio
+import hashlib
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("langchain.text_splitter")
+
+from langchain_core.documents import Document
+
+from reasoning import vector_store
+from reasoning.vector_store import GhanaLegalVectorStore, TokenWindowSplitter
+
+
+class FakeEmbeddings:
+    """Hashed bag-of-words vectors; records every text it embeds"""
+
+    dimensions = 64
+
+    def __init__(self):
+        self.embedded = []
+        self.threads = set()
+
+    def _vector(self, text):
+        vec = np.zeros(self.dimensions)
+        for word in text.lower().split():
+            vec[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dimensions] += 1
+        norm = np.linalg.norm(vec)
+        return list(vec / norm) if norm else list(vec)
+
+    def embed_documents(self, texts):
+        self.threads.add(threading.get_ident())
+        self.embedded.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+class FakeChroma:
+    """The parts of the LangChain Chroma wrapper the store uses, in memory"""
+
+    def __init__(self):
+        self.rows = {}  # id -> (text, metadata, vector)
+        self.embedding_function = None
+
+    def get(self, ids=None, include=()):
+        ids = [i for i in (self.rows if ids is None else ids) if i in self.rows]
+        result = {"ids": ids}
+        if "embeddings" in include:
+            result["embeddings"] = [self.rows[i][2] for i in ids]
+        return result
+
+    def add_texts(self, texts, metadatas=None, ids=None):
+        vectors = self.embedding_function.embed_documents(texts)
+        for row in zip(ids, texts, metadatas, vectors):
+            self.rows[row[0]] = row[1:]
+        return ids
+
+    def similarity_search_by_vector_with_relevance_scores(self, embedding, k):
+        scored = sorted(
+            ((float(np.dot(vector, embedding)), text, metadata)
+             for text, metadata, vector in self.rows.values()),
+            key=lambda row: row[0],
+            reverse=True
+        )
+        return [(Document(page_content=text, metadata=metadata), score)
+                for score, text, metadata in scored[:k]]
+
+    def persist(self):
+        pass
+
+
+def make_store(tmp_path, monkeypatch, chroma=None):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    store = GhanaLegalVectorStore(persist_dir=str(tmp_path))
+    store.embeddings = FakeEmbeddings()
+    store.vectorstore = chroma if chroma is not None else FakeChroma()
+    store.vectorstore.embedding_function = vector_store._StoreEmbeddings(store)
+    return store
+
+
+class TestIdempotentIngest:
+    """Chunks are keyed by content, so re-ingesting stores and embeds nothing new"""
+
+    def test_second_ingest_adds_nothing(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+
+        store.ingest_all()
+        stored = dict(store.vectorstore.rows)
+        embedded = len(store.embeddings.embedded)
+        store.ingest_all()
+
+        assert stored
+        assert store.vectorstore.rows == stored
+        assert len(store.embeddings.embedded) == embedded
+
+    def test_restart_reuses_persisted_chunks(self, tmp_path, monkeypatch):
+        chroma = FakeChroma()
+        make_store(tmp_path, monkeypatch, chroma).ingest_all()
+
+        restarted = make_store(tmp_path, monkeypatch, chroma)
+        restarted.ingest_all()
+
+        assert restarted.embeddings.embedded == []
+
+    def test_chunk_id_depends_on_title_and_text(self):
+        doc = Document(page_content="Stool land is held in trust", metadata={"title": "Akan"})
+        same = Document(page_content="Stool land is held in trust", metadata={"title": "Akan", "year": 1})
+        other_title = Document(page_content="Stool land is held in trust", metadata={"title": "Ga"})
+
+        assert vector_store._chunk_id(doc) == vector_store._chunk_id(same)
+        assert vector_store._chunk_id(doc) != vector_store._chunk_id(other_title)
+
+
+class TestParentChildRetrieval:
+    """Search matches child chunks and returns their distinct parent chunks"""
+
+    def test_children_point_at_recorded_parents(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+
+        store.ingest_all()
+
+        for text, metadata, _ in store.vectorstore.rows.values():
+            assert metadata["parent_id"] in store.parents
+
+    def test_search_returns_distinct_parents(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+        store.ingest_all()
+
+        results = store.semantic_search("bride price akpeteshi family consent", k=3)
+        contents = [result["content"] for result in results]
+
+        assert 0 < len(contents) <= 3
+        assert len(set(contents)) == len(contents)
+        assert all(content in store.parents.values() for content in contents)
+        assert "akpeteshi" in contents[0]
+
+    def test_parents_survive_persist(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+        store.ingest_all()
+        store.persist()
+
+        reloaded = make_store(tmp_path, monkeypatch)
+
+        assert reloaded.parents == store.parents
+
+
+class TestConcurrentEmbedding:
+    """Multi-request embeds run on a thread pool and keep input order"""
+
+    def test_batches_keep_input_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vector_store, "EMBED_BATCH_SIZE", 2)
+        store = make_store(tmp_path, monkeypatch)
+        texts = [f"clause {i} of the tenancy agreement" for i in range(9)]
+
+        vectors = store._embed_texts(texts)
+
+        assert vectors == [store.embeddings.embed_query(text) for text in texts]
+        assert threading.get_ident() not in store.embeddings.threads
+
+    def test_added_chunks_are_embedded_in_batches(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vector_store, "EMBED_BATCH_SIZE", 2)
+        store = make_store(tmp_path, monkeypatch)
+        batch_sizes = []
+        embed_documents = store.embeddings.embed_documents
+        store.embeddings.embed_documents = lambda texts: batch_sizes.append(len(texts)) or embed_documents(texts)
+        docs = [
+            Document(page_content=f"Clause {i} of the tenancy agreement binds the lessee and lessor.",
+                     metadata={"title": "Rent Act"})
+            for i in range(5)
+        ]
+
+        assert store._add_documents(docs) == 5
+        assert sorted(batch_sizes) == [1, 2, 2]
+        assert len(store.vectorstore.rows) == 5
+
+    def test_works_inside_a_running_event_loop(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vector_store, "EMBED_BATCH_SIZE", 2)
+        store = make_store(tmp_path, monkeypatch)
+        texts = [f"clause {i} of the tenancy agreement" for i in range(5)]
+
+        async def embed_in_loop():
+            return store._embed_texts(texts)
+
+        first = asyncio.run(embed_in_loop())
+        second = asyncio.run(embed_in_loop())
+
+        assert first == second == [store.embeddings.embed_query(text) for text in texts]
+
+
+class ByteEncoding:
+    """One token per UTF-8 byte, decoding like tiktoken's Encoding"""
+
+    def encode_ordinary(self, text):
+        return list(text.encode())
+
+    def decode(self, tokens):
+        return bytes(tokens).decode(errors="replace")
+
+    def decode_with_offsets(self, tokens):
+        offsets = []
+        text_len = 0
+        for token in tokens:
+            offsets.append(max(0, text_len - (0x80 <= token < 0xC0)))
+            text_len += not 0x80 <= token < 0xC0
+        return bytes(tokens).decode(), offsets
+
+
+class TestTokenWindowSplitter:
+    """Token windows never cut a multi-byte character"""
+
+    TEXT = "Nana Ɔsɛe Kɔfi and Adwoa Bɛnyiwa dispute the Ɛwɛ stool land at Ŋɔtsie. " * 6
+
+    def test_windows_keep_multibyte_characters_whole(self, monkeypatch):
+        encoding = ByteEncoding()
+        monkeypatch.setattr(vector_store, "_encoding", lambda: encoding)
+        splitter = TokenWindowSplitter(window_tokens=17, overlap_tokens=4, fallback=None)
+
+        # Plain byte windows of this text do cut characters
+        tokens = encoding.encode_ordinary(self.TEXT)
+        assert any("\ufffd" in encoding.decode(tokens[i:i + 17]) for i in range(0, len(tokens), 13))
+
+        chunks = splitter.split_text(self.TEXT)
+
+        assert len(chunks) > 1
+        assert all("\ufffd" not in chunk and chunk in self.TEXT for chunk in chunks)
+        assert self.TEXT.startswith(chunks[0]) and self.TEXT.endswith(chunks[-1])
+
+    def test_windows_overlap_and_cover_the_text(self, monkeypatch):
+        monkeypatch.setattr(vector_store, "_encoding", lambda: ByteEncoding())
+        splitter = TokenWindowSplitter(window_tokens=17, overlap_tokens=4, fallback=None)
+
+        chunks = splitter.split_text(self.TEXT)
+        position = 0
+        for chunk in chunks:
+            start = self.TEXT.index(chunk, max(0, position - len(chunk)))
+            assert start <= position
+            position = start + len(chunk)
+
+        assert position == len(self.TEXT)
+
+    def test_short_text_is_one_window(self, monkeypatch):
+        monkeypatch.setattr(vector_store, "_encoding", lambda: ByteEncoding())
+        splitter = TokenWindowSplitter(window_tokens=200, overlap_tokens=20, fallback=None)
+
+        assert splitter.split_text("Ɔman Ɛwɛ") == ["Ɔman Ɛwɛ"]
+
+
+class TestChunkFiltering:
+    """Near-empty and repeated chunks are dropped before embedding"""
+
+    BOILERPLATE = "Key sections: offer, acceptance, breach and remedies under Ghana law."
+
+    def test_short_chunks_are_not_stored(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+        docs = [
+            Document(page_content="   Key sections:  ", metadata={"title": "Contracts Act"}),
+            Document(page_content=self.BOILERPLATE, metadata={"title": "Contracts Act"}),
+        ]
+
+        added = store._add_documents(docs)
+
+        assert added == 1
+        assert store.embeddings.embedded == [self.BOILERPLATE]
+
+    def test_repeated_text_is_embedded_once(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+        docs = [
+            Document(page_content=self.BOILERPLATE, metadata={"title": "Contracts Act"}),
+            Document(page_content=self.BOILERPLATE, metadata={"title": "Sale of Goods Act"}),
+            Document(page_content=self.BOILERPLATE + " Stool land is excluded.", metadata={"title": "Property Act"}),
+        ]
+
+        added = store._add_documents(docs)
+
+        assert added == 2
+        assert len(store.embeddings.embedded) == 2
+
+    def test_nothing_left_to_add(self, tmp_path, monkeypatch):
+        store = make_store(tmp_path, monkeypatch)
+
+        assert store._add_documents([Document(page_content="", metadata={})]) == 0
+        assert store.vectorstore.rows == {}